@@ -27,6 +27,19 @@ logger = get_logger(__name__)
 _session_pool: Optional[aiohttp.ClientSession] = None
 _session_lock = asyncio.Lock()
 
+# Optional HTTP/2 transport for raw RPC posts (requires httpx[http2]).
+# Concurrent requests multiplex over one connection instead of queueing
+# behind the HTTP/1.1 per-host connection limit.
+try:
+    import h2  # noqa: F401
+    import httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    httpx = None
+
+_http2_pool: Optional["httpx.AsyncClient"] = None
+
 # Optional import for failover support
 try:
     from infrastructure.rpc_failover import RPCFailoverManager
@@ -282,16 +295,42 @@ class SolanaClient:
         
         return _session_pool
 
+    @staticmethod
+    async def get_http2_client() -> "httpx.AsyncClient":
+        """Get or create the shared HTTP/2 client (only when HTTP2_AVAILABLE).
+
+        Returns:
+            Shared httpx.AsyncClient with HTTP/2 enabled
+        """
+        global _http2_pool
+
+        async with _session_lock:
+            if _http2_pool is None or _http2_pool.is_closed:
+                _http2_pool = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=10, max_keepalive_connections=10
+                    ),
+                    timeout=httpx.Timeout(30, connect=10),
+                )
+                logger.debug("Created new HTTP/2 client")
+
+        return _http2_pool
+
     @staticmethod
     async def close_session_pool() -> None:
         """Close the global session pool."""
-        global _session_pool
+        global _session_pool, _http2_pool
         
         async with _session_lock:
             if _session_pool and not _session_pool.closed:
                 await _session_pool.close()
                 _session_pool = None
                 logger.debug("Closed HTTP session pool")
+            if _http2_pool and not _http2_pool.is_closed:
+                await _http2_pool.aclose()
+                _http2_pool = None
+                logger.debug("Closed HTTP/2 client")
 
     async def get_balance(self, pubkey: Pubkey) -> int:
         """Get SOL balance for an account.
@@ -336,6 +375,16 @@ class SolanaClient:
         response = await client.get_latest_blockhash(commitment="processed")
         return response.value.blockhash
 
+    async def get_slot(self) -> int:
+        """Get the current slot.
+
+        Returns:
+            Current slot number
+        """
+        client = await self.get_client()
+        response = await client.get_slot(commitment="processed")
+        return response.value
+
     async def build_and_send_transaction(
         self,
         instructions: list[Instruction],
@@ -509,6 +558,9 @@ class SolanaClient:
         """
         if self.use_failover:
             return await self.failover_manager.post_rpc(body)
+
+        if HTTP2_AVAILABLE:
+            return await self._post_rpc_http2(body)
         
         try:
             # Use shared connection pool for better performance
@@ -525,3 +577,24 @@ class SolanaClient:
         except json.JSONDecodeError:
             logger.exception("Failed to decode RPC response")
             return None
+
+    async def _post_rpc_http2(self, body: dict[str, Any]) -> dict[str, Any] | None:
+        """Send a raw RPC request over the shared HTTP/2 connection.
+
+        Args:
+            body: JSON-RPC request body.
+
+        Returns:
+            Optional[Dict[str, Any]]: Parsed JSON response, or None if the request fails.
+        """
+        try:
+            client = await self.get_http2_client()
+            response = await client.post(self.rpc_endpoint, json=body)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            logger.exception("RPC request failed")
+            return None
+        except json.JSONDecodeError:
+            logger.exception("Failed to decode RPC response")
+            return None
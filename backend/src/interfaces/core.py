@@ -21,7 +21,7 @@ class Platform(Enum):
     LETS_BONK = "lets_bonk"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
     """Enhanced token information with platform support."""
 
@@ -54,6 +54,10 @@ class TokenInfo:
     virtual_token_reserves: float | None = None
     token_total_supply: float | None = None
 
+    # Market data (None when not yet observed)
+    liquidity: float | None = None
+    volume_24h: float | None = None
+
 
 class AddressProvider(ABC):
     """Abstract interface for platform-specific address management."""
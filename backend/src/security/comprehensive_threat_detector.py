@@ -611,63 +611,69 @@ class ComprehensiveThreatDetector:
                 ...
             }
         """
-        logger.info(f"Running all threat detections for token: {token_info.mint_address}")
+        logger.info(f"Running all threat detections for token: {token_info.mint}")
 
-        # Import ThreatImplementations
-        from security.threat_implementations import ThreatImplementations
+        from security.threat_implementations import ThreatDetectionMethods
 
         # Initialize threat detector
-        impl = ThreatImplementations(self.client)
+        impl = ThreatDetectionMethods(self.client)
 
         # Run all detection methods
         results = {}
 
         try:
-            # Token-2022 threats (3 methods)
-            results["transfer_hook_exploit"] = await impl.detect_transfer_hook_exploit(token_info)
-            results["permanent_delegate"] = await impl.detect_permanent_delegate(token_info)
-            results["confidential_transfer_abuse"] = await impl.detect_confidential_transfer_abuse(token_info)
-            results["token_metadata_manipulation"] = await impl.detect_token_metadata_manipulation(token_info)
-            results["freeze_authority_risk"] = await impl.detect_freeze_authority_risk(token_info)
-            results["mint_authority_risk"] = await impl.detect_mint_authority_risk(token_info)
-
-            # Rug pull threats (4 methods)
-            results["honeypot"] = await impl.detect_honeypot(token_info)
-            results["rug_pull_imminent"] = await impl.detect_rug_pull_imminent(token_info)
-            results["liquidity_removal"] = await impl.detect_liquidity_removal(token_info)
-            results["creator_exit"] = await impl.detect_creator_exit(token_info)
-
-            # Volume & pattern threats (2 methods)
-            results["wash_trading"] = await impl.detect_wash_trading(token_info)
-            results["pump_and_dump"] = await impl.detect_pump_and_dump(token_info)
-
-            # Oracle threats (2 methods)
-            results["oracle_manipulation"] = await impl.detect_oracle_manipulation(token_info)
-            results["oracle_staleness"] = await impl.detect_oracle_staleness(token_info)
-
-            # Flash loan threats (1 method)
-            results["flash_loan_vulnerability"] = await impl.detect_flash_loan_vulnerability(token_info)
-
-            # MEV threats (2 methods)
-            results["sandwich_attack_risk"] = await impl.detect_sandwich_attack_risk(token_info)
-            results["front_running_risk"] = await impl.detect_front_running_risk(token_info)
-
-            # Bonding curve threats (2 methods)
-            results["bonding_curve_manipulation"] = await impl.detect_bonding_curve_manipulation(token_info)
-            results["curve_exhaustion"] = await impl.detect_curve_exhaustion(token_info)
-
-            # Governance threats (2 methods)
-            results["governance_attack_risk"] = await impl.detect_governance_attack_risk(token_info)
-            results["proposal_manipulation"] = await impl.detect_proposal_manipulation(token_info)
-
-            # Smart contract vulnerabilities (3 methods)
-            results["reentrancy_risk"] = await impl.detect_reentrancy_risk(token_info)
-            results["integer_overflow_risk"] = await impl.detect_integer_overflow_risk(token_info)
-            results["access_control_issues"] = await impl.detect_access_control_issues(token_info)
-
-            # Social engineering (2 methods)
-            results["phishing_risk"] = await impl.detect_phishing_risk(token_info)
-            results["wallet_drainer_risk"] = await impl.detect_wallet_drainer_risk(token_info)
+            # Fetch shared RPC resources once, then fan out every detector
+            ctx = await impl.prefetch(token_info)
+
+            detectors = {
+                # Token-2022 threats
+                "transfer_hook_exploit": impl.detect_transfer_hook_exploit,
+                "permanent_delegate": impl.detect_permanent_delegate,
+                "confidential_transfer_abuse": impl.detect_confidential_transfer_abuse,
+                "token_metadata_manipulation": impl.detect_token_metadata_manipulation,
+                "freeze_authority_risk": impl.detect_freeze_authority_risk,
+                "mint_authority_risk": impl.detect_mint_authority_risk,
+                # Rug pull threats
+                "honeypot": impl.detect_honeypot,
+                "rug_pull_imminent": impl.detect_rug_pull_imminent,
+                "liquidity_removal": impl.detect_liquidity_removal,
+                "creator_exit": impl.detect_creator_exit,
+                # Volume & pattern threats
+                "wash_trading": impl.detect_wash_trading,
+                "pump_and_dump": impl.detect_pump_and_dump,
+                # Oracle threats
+                "oracle_manipulation": impl.detect_oracle_manipulation,
+                "oracle_staleness": impl.detect_oracle_staleness,
+                # Flash loan threats
+                "flash_loan_vulnerability": impl.detect_flash_loan_vulnerability,
+                # MEV threats
+                "sandwich_attack_risk": impl.detect_sandwich_attack_risk,
+                "front_running_risk": impl.detect_front_running_risk,
+                # Bonding curve threats
+                "bonding_curve_manipulation": impl.detect_bonding_curve_manipulation,
+                "curve_exhaustion": impl.detect_curve_exhaustion,
+                # Governance threats
+                "governance_attack_risk": impl.detect_governance_attack_risk,
+                "proposal_manipulation": impl.detect_proposal_manipulation,
+                # Smart contract vulnerabilities
+                "reentrancy_risk": impl.detect_reentrancy_risk,
+                "integer_overflow_risk": impl.detect_integer_overflow_risk,
+                "access_control_issues": impl.detect_access_control_issues,
+                # Social engineering
+                "phishing_risk": impl.detect_phishing_risk,
+                "wallet_drainer_risk": impl.detect_wallet_drainer_risk,
+            }
+
+            outcomes = await asyncio.gather(
+                *(detect(token_info, ctx) for detect in detectors.values()),
+                return_exceptions=True,
+            )
+
+            for name, outcome in zip(detectors, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Detector {name} failed: {outcome}")
+                    outcome = None
+                results[name] = outcome
 
             logger.info(f"Completed threat detection: {sum(1 for v in results.values() if v is not None)} threats found")
 
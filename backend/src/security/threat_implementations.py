@@ -6,20 +6,452 @@ These methods are called by comprehensive_threat_detector.py.
 """
 
 import asyncio
+import functools
+import json
+import logging
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Tuple
 import time
 import statistics
-from collections import defaultdict
+import weakref
 
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
 
 from core.client import SolanaClient
-from interfaces.core import TokenInfo
+from interfaces.core import Platform, TokenInfo
 from utils.logger import get_logger
 
+# Optional RE2 for linear-time (DFA) matching of URL phishing patterns
+try:
+    import re2 as _url_re
+except ImportError:
+    # Fallback to stdlib re if RE2 not available
+    _url_re = re
+
+# Optional orjson for faster metadata parsing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Module-level caches so results outlive a single TokenInfo scan.
+# Entries are (value, expiry) tuples; expiry None means never expires.
+_CACHE_MAX_SIZE = 1000
+_PROGRAM_CACHE: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()  # mint account data per mint
+_ORACLE_CACHE: "OrderedDict[Tuple[str, int], Tuple[Any, Optional[float]]]" = OrderedDict()  # per slot bucket
+_SLOT_CACHE: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()  # per RPC endpoint
+_PROGRAM_TTL = 60.0  # seconds; the mint account changes when authorities change
+_ORACLE_SLOT_BUCKET = 1  # slots per oracle cache generation
+_SLOT_DURATION = 0.4  # seconds per Solana slot, approximately
+_SLOT_TTL = min(_SLOT_DURATION, 0.2)  # seconds a cached slot stays fresh
+_ORACLE_STALE_SLOTS = 100  # ~1 minute without an update
+_ORACLE_SOURCES = ("pyth", "switchboard", "chainlink")
+_ORACLE_SOURCE_TIMEOUT = 2.0  # seconds; one slow feed must not stall the scan
+_BATCH_WINDOW = 0.005  # seconds to collect account fetches before flushing
+_BATCH_MAX_KEYS = 100  # getMultipleAccounts limit per request
+_IN_FLIGHT: Dict[Tuple[int, Any], asyncio.Future] = {}  # (cache id, key) -> pending load
+
+# Wash trading pattern thresholds
+_WASH_RAPID_WINDOW = 60.0  # seconds between opposite-direction trades
+_WASH_MIN_RAPID_FLIPS = 2
+_WASH_MAX_INTERVAL_CV = 0.10  # interval std/mean below this looks scripted
+
+# Token-2022 mint layout: base account padded to 165 bytes, one
+# account-type byte, then (u16 type, u16 length, value) TLV entries
+_TOKEN_2022_TLV_START = 166
+_TLV_HEADER = struct.Struct("<HH")
+_TOKEN_2022_EXTENSION_TYPES = {
+    "TransferFeeConfig": 1,
+    "MintCloseAuthority": 3,
+    "ConfidentialTransfer": 4,
+    "DefaultAccountState": 6,
+    "NonTransferable": 9,
+    "InterestBearingConfig": 10,
+    "PermanentDelegate": 12,
+    "TransferHook": 14,
+    "MetadataPointer": 18,
+    "TokenMetadata": 19,
+}
+_EMPTY_PUBKEY = bytes(32)
+
+_BONDING_CURVE_PLATFORMS: frozenset = frozenset({Platform.PUMP_FUN, Platform.LETS_BONK})
+
+# Phishing phrase lists, compiled once into single alternations so each
+# text is scanned in one pass regardless of how many phrases are listed
+_SCAM_KEYWORDS = ("urgent", "airdrop", "claim now", "limited time")
+_SUSPICIOUS_URL_TOKENS = (
+    "airdrop",
+    "claim",
+    "giveaway",
+    "free-",
+    "connect-wallet",
+    "walletconnect",
+    "wallet-verify",
+    "validate",
+    "xn--",  # punycode lookalike domains
+)
+_SUSPICIOUS_URL_REGEXES = (
+    r"://\d{1,3}(?:\.\d{1,3}){3}(?:[:/]|$)",  # raw IP host
+    r"://[^/]*@",  # user-info prefix hiding the real host
+    r"://(?:bit\.ly|tinyurl\.com|t\.co|is\.gd)/",  # link shorteners
+)
+_SCAM_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, _SCAM_KEYWORDS)))
+# All URL tokens and regexes compiled into one case-insensitive pattern
+_SUSPICIOUS_URL_PATTERN = _url_re.compile(
+    "(?i)" + "|".join([*map(re.escape, _SUSPICIOUS_URL_TOKENS), *_SUSPICIOUS_URL_REGEXES])
+)
+
+
+async def _cached(cache: OrderedDict, key: Any, loader, ttl: Optional[float]) -> Any:
+    """
+    Return cache[key], loading it at most once across concurrent callers
+
+    Concurrent misses share a single in-flight future (single-flight),
+    which is evicted once the load finishes. None results are not cached
+    so transient failures are retried.
+    """
+    entry = cache.get(key)
+    if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+        return entry[0]
+
+    flight_key = (id(cache), key)
+    future = _IN_FLIGHT.get(flight_key)
+    if future is None:
+        future = asyncio.ensure_future(_load_into(cache, key, loader, ttl))
+        _IN_FLIGHT[flight_key] = future
+        future.add_done_callback(lambda _: _IN_FLIGHT.pop(flight_key, None))
+
+    # Shield so one cancelled caller does not cancel the shared load
+    return await asyncio.shield(future)
+
+
+async def _load_into(cache: OrderedDict, key: Any, loader, ttl: Optional[float]) -> Any:
+    """Run loader and store a non-None result in cache"""
+    value = await loader()
+    if value is not None:
+        cache[key] = (value, None if ttl is None else time.monotonic() + ttl)
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def _fail_pending(pending: Dict[Pubkey, asyncio.Future], error: BaseException) -> None:
+    """Set error on every future in pending that is still unresolved"""
+    for future in pending.values():
+        if not future.done():
+            future.set_exception(error)
+
+
+class _BatchProgramFetcher:
+    """
+    Coalesces single-account fetches into getMultipleAccounts calls.
+
+    Requests arriving within _BATCH_WINDOW are flushed together, split into
+    chunks of _BATCH_MAX_KEYS pubkeys, and each caller's future is resolved
+    from the batched response.
+    """
+
+    def __init__(self, client: SolanaClient):
+        # Weak: this fetcher is the value stored under client in _BATCH_FETCHERS,
+        # and a strong reference back to its key would keep the client alive
+        self._client_ref = weakref.ref(client)
+        self._pending: Dict[Pubkey, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def fetch(self, pubkey: Pubkey) -> Optional[bytes]:
+        """Queue pubkey for the next batch and wait for its account data"""
+        future = self._pending.get(pubkey)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[pubkey] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.ensure_future(self._flush_after_window())
+                self._flush_task.add_done_callback(self._on_flush_done)
+        return await asyncio.shield(future)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        # Still the current flush task means it was cancelled before taking the
+        # batch (possibly before it ever ran): fail the queued futures here
+        if self._flush_task is task:
+            pending, self._pending = self._pending, {}
+            self._flush_task = None
+            _fail_pending(pending, RuntimeError("Batched account fetch was cancelled"))
+
+    async def _flush_after_window(self) -> None:
+        pending: Dict[Pubkey, asyncio.Future] = {}
+        error: BaseException = RuntimeError("Batched account fetch was cancelled")
+        try:
+            await asyncio.sleep(_BATCH_WINDOW)
+            pending, self._pending = self._pending, {}
+            self._flush_task = None
+
+            client = self._client_ref()
+            if client is None:
+                error = RuntimeError("SolanaClient was closed before the batch was fetched")
+                return
+
+            keys = list(pending)
+            chunks = [keys[i:i + _BATCH_MAX_KEYS] for i in range(0, len(keys), _BATCH_MAX_KEYS)]
+            results = await asyncio.gather(
+                *(client.get_multiple_accounts(chunk) for chunk in chunks),
+                return_exceptions=True,
+            )
+
+            for chunk, result in zip(chunks, results):
+                for i, key in enumerate(chunk):
+                    future = pending[key]
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result[i] if i < len(result) else None)
+        finally:
+            # Never leave a caller waiting on a future nobody will resolve
+            _fail_pending(pending, error)
+
+
+# One batch fetcher per client, shared by every detector instance
+_BATCH_FETCHERS: "weakref.WeakKeyDictionary[SolanaClient, _BatchProgramFetcher]" = weakref.WeakKeyDictionary()
+
+
+def scored_detector(
+    checks: List[Tuple[float, str]],
+    threshold: float,
+    severity: str,
+    score_label: str,
+    reason: str,
+    risk: str,
+):
+    """
+    Build a weighted-check detector whose evaluation plan is fixed at import.
+
+    checks are (weight, method name) pairs; each method takes
+    (token_info, ctx) and returns bool. Check order (descending weight) and
+    the score floor below which the threshold becomes unreachable are
+    computed once here, so a call only compares against precomputed bounds.
+    Evaluation stops as soon as the outcome is decided, so the reported
+    score is a lower bound once the threshold is met.
+    """
+    ordered = sorted(checks, key=lambda check: check[0], reverse=True)
+    plan = tuple(
+        # (weight, method name, minimum score needed before this check)
+        (weight, name, threshold - sum(w for w, _ in ordered[i:]) - 1e-9)
+        for i, (weight, name) in enumerate(ordered)
+    )
+
+    def decorate(func):
+        label = func.__name__.removeprefix("detect_").replace("_", " ")
+
+        @functools.wraps(func)
+        async def detector(self, token_info: TokenInfo, ctx: "ThreatContext") -> Optional[Tuple[str, float, Dict]]:
+            try:
+                score = 0.0
+                for weight, name, floor in plan:
+                    if score >= threshold or score < floor:
+                        break
+                    if await getattr(self, name)(token_info, ctx):
+                        score += weight
+
+                if score >= threshold:
+                    return (
+                        severity,
+                        score,
+                        {
+                            score_label: f"{score:.0%}",
+                            "reason": reason,
+                            "risk": risk
+                        }
+                    )
+
+                return None
+
+            except Exception as e:
+                logger.error("Error detecting %s: %s", label, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+                return None
+
+        return detector
+
+    return decorate
+
+
+# TxBatch.action codes
+ACTION_UNKNOWN = 0
+ACTION_BUY = 1
+ACTION_SELL = 2
+
+
+def _parse_token_metadata(raw: bytes) -> Optional[Dict]:
+    """Parse an off-chain metadata JSON body; bytes go straight to orjson without a UTF-8 decode"""
+    metadata = _json_loads(raw)
+    return metadata if isinstance(metadata, dict) else None
+
+
+def _find_sandwich_pairs(slots: List[int], signer_ids: List[int], actions: List[int]) -> List[Tuple[int, int]]:
+    """
+    Find (front, back) sandwich pairs in block-ordered transaction columns
+
+    Single pass: each signer's previous position is remembered, and a pair
+    is emitted when that signer trades the opposite direction in the same
+    slot with at least one other signer's same-direction trade (the victim)
+    in between. Running buy/sell counts make the victim check O(1).
+    """
+    pairs: List[Tuple[int, int]] = []
+    last_pos: Dict[int, int] = {}
+    buys = sells = 0
+    buys_before = [0] * len(actions)  # buys strictly before position i
+    sells_before = [0] * len(actions)
+
+    for i, (slot, signer, action) in enumerate(zip(slots, signer_ids, actions)):
+        buys_before[i] = buys
+        sells_before[i] = sells
+
+        front = last_pos.get(signer)
+        if front is not None and slots[front] == slot:
+            front_action = actions[front]
+            if front_action == ACTION_BUY and action == ACTION_SELL:
+                if buys_before[i] - buys_before[front] > 1:
+                    pairs.append((front, i))
+            elif front_action == ACTION_SELL and action == ACTION_BUY:
+                if sells_before[i] - sells_before[front] > 1:
+                    pairs.append((front, i))
+
+        last_pos[signer] = i
+        if action == ACTION_BUY:
+            buys += 1
+        elif action == ACTION_SELL:
+            sells += 1
+
+    return pairs
+
+
+@dataclass(slots=True)
+class TxBatch:
+    """
+    Struct-of-arrays transaction list: one typed column per field.
+
+    Signer addresses are interned to integer ids while the batch is built,
+    so scans compare ints and read contiguous columns instead of calling
+    an accessor per transaction.
+    """
+
+    slot: array = field(default_factory=lambda: array("q"))
+    tx_index: array = field(default_factory=lambda: array("q"))
+    signer_id: array = field(default_factory=lambda: array("I"))
+    action: array = field(default_factory=lambda: array("b"))  # ACTION_* code
+    amount: array = field(default_factory=lambda: array("d"))
+    timestamp: array = field(default_factory=lambda: array("d"))
+    signers: List[str] = field(default_factory=list)  # signer_id -> address
+    _signer_ids: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.slot)
+
+    def append(self, slot: int, tx_index: int, signer: str, action: int, amount: float, timestamp: float) -> None:
+        """Append one parsed transaction"""
+        signer_id = self._signer_ids.get(signer)
+        if signer_id is None:
+            signer_id = self._signer_ids[signer] = len(self.signers)
+            self.signers.append(signer)
+
+        self.slot.append(slot)
+        self.tx_index.append(tx_index)
+        self.signer_id.append(signer_id)
+        self.action.append(action)
+        self.amount.append(amount)
+        self.timestamp.append(timestamp)
+
+    def where_action(self, action: int) -> List[int]:
+        """Indices of transactions with the given ACTION_* code"""
+        return [i for i, a in enumerate(self.action) if a == action]
+
+    def block_order(self) -> List[int]:
+        """Indices sorted by (slot, tx_index)"""
+        slot, tx_index = self.slot, self.tx_index
+        return sorted(range(len(slot)), key=lambda i: (slot[i], tx_index[i]))
+
+
+@dataclass(frozen=True, slots=True)
+class OracleSummary:
+    """Aggregate of fresh oracle feeds, computed once per scan."""
+
+    prices: Tuple[float, ...]  # fresh feeds only
+    median: float
+    divergence: float  # (max - min) / median across fresh feeds
+    max_deviation: Optional[float]  # worst |feed - dex| / dex, None without a DEX price
+    worst_stale_slots: Optional[int]  # slots since the oldest feed updated
+
+
+def _summarize_oracles(
+    prices: Tuple[float, ...],
+    update_slots: Tuple[int, ...],
+    dex_price: Optional[float],
+    current_slot: Optional[int],
+) -> Optional[OracleSummary]:
+    """Filter stale feeds and compute median/divergence/deviation in one sweep"""
+    worst_stale_slots = None
+    if current_slot is not None and len(update_slots) == len(prices):
+        ages = [current_slot - slot for slot in update_slots]
+        worst_stale_slots = max(ages, default=None)
+        prices = tuple(price for price, age in zip(prices, ages) if age <= _ORACLE_STALE_SLOTS)
+
+    if not prices:
+        return None
+
+    # Single sort serves median, min and max; for the handful of feeds
+    # involved the C sort beats a Python-level quickselect
+    ordered = sorted(prices)
+    n = len(ordered)
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    low, high = ordered[0], ordered[-1]
+
+    max_deviation = None
+    if dex_price:
+        max_deviation = max(abs(low - dex_price), abs(high - dex_price)) / dex_price
+
+    return OracleSummary(
+        prices=prices,
+        median=median,
+        divergence=(high - low) / median if median else 0.0,
+        max_deviation=max_deviation,
+        worst_stale_slots=worst_stale_slots,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ThreatContext:
+    """
+    Resources shared by every detector during a single token scan.
+
+    Built once by ThreatDetectionMethods.prefetch() so detectors read from
+    memory instead of re-issuing identical RPC calls.
+    """
+
+    mint_account: Optional[Any] = None
+    program_data: Optional[bytes] = None  # not prefetched until a detector reads it
+    oracle_data: Optional[Dict] = None
+    oracle_prices: Tuple[float, ...] = ()  # one entry per oracle feed
+    oracle_update_slots: Tuple[int, ...] = ()  # last update slot, parallel to oracle_prices
+    dex_price: Optional[float] = None
+    oracle_summary: Optional[OracleSummary] = None
+    recent_txs: TxBatch = field(default_factory=TxBatch)
+    metadata: Optional[Dict] = None
+    current_slot: Optional[int] = None
+    governance_data: Optional[Dict] = None
+    active_proposals: List[Dict] = field(default_factory=list)
+
 
 class ThreatDetectionMethods:
     """
@@ -40,12 +472,67 @@ class ThreatDetectionMethods:
 
     def __init__(self, client: SolanaClient):
         self.client = client
+        self.oracle_sources: Tuple[str, ...] = _ORACLE_SOURCES
+
+    async def prefetch(self, token_info: TokenInfo) -> ThreatContext:
+        """
+        Fetch all shared detector inputs concurrently, exactly once per scan
+
+        Failed fetches are logged and left empty so one bad RPC does not
+        abort the whole scan.
+
+        Returns: ThreatContext passed to every detect_* method
+        """
+        mint = token_info.mint
+        fields = (
+            "mint_account",
+            "oracle_data",
+            "oracle_feeds",
+            "dex_price",
+            "recent_txs",
+            "metadata",
+            "current_slot",
+            "governance_data",
+            "active_proposals",
+        )
+        results = await asyncio.gather(
+            self.client.get_account_info(mint),
+            self._fetch_oracle_data(mint),
+            self._fetch_oracle_prices(mint),
+            self._fetch_dex_price(token_info),
+            self._get_token_transactions(mint, limit=200),
+            self._fetch_token_metadata(mint),
+            self.current_slot(),
+            self._fetch_governance_data(mint),
+            self._fetch_active_proposals(mint),
+            return_exceptions=True,
+        )
+
+        resources = {}
+        for name, result in zip(fields, results):
+            if isinstance(result, Exception):
+                logger.debug("Prefetch of %s failed: %s", name, result)
+                continue
+            resources[name] = result
+
+        # Split (price, last_update_slot) feeds into parallel columns
+        feeds = resources.pop("oracle_feeds", None) or []
+        resources["oracle_prices"] = tuple(price for price, _ in feeds)
+        resources["oracle_update_slots"] = tuple(slot for _, slot in feeds)
+        resources["oracle_summary"] = _summarize_oracles(
+            resources["oracle_prices"],
+            resources["oracle_update_slots"],
+            resources.get("dex_price"),
+            resources.get("current_slot"),
+        )
+
+        return ThreatContext(**resources)
 
     # ========================================================================
     # TOKEN-2022 EXTENSION THREATS
     # ========================================================================
 
-    async def detect_transfer_hook_exploit(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_transfer_hook_exploit(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect malicious transfer hooks in Token-2022
 
@@ -53,7 +540,7 @@ class ThreatDetectionMethods:
         """
         try:
             # Check if token is Token-2022
-            mint_account = await self.client.get_account_info(token_info.mint)
+            mint_account = ctx.mint_account
             if not mint_account:
                 return None
 
@@ -102,17 +589,17 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting transfer hook exploit: {e}")
+            logger.error("Error detecting transfer hook exploit: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_permanent_delegate(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_permanent_delegate(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect permanent delegate risk (can transfer tokens from any account)
 
         Returns: (severity, confidence, evidence) or None
         """
         try:
-            mint_account = await self.client.get_account_info(token_info.mint)
+            mint_account = ctx.mint_account
             if not mint_account or not mint_account.value:
                 return None
 
@@ -137,17 +624,17 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting permanent delegate: {e}")
+            logger.error("Error detecting permanent delegate: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_confidential_transfer_abuse(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_confidential_transfer_abuse(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect confidential transfer abuse (hidden balance manipulation)
 
         Returns: (severity, confidence, evidence) or None
         """
         try:
-            mint_account = await self.client.get_account_info(token_info.mint)
+            mint_account = ctx.mint_account
             if not mint_account or not mint_account.value:
                 return None
 
@@ -173,14 +660,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting confidential transfer abuse: {e}")
+            logger.error("Error detecting confidential transfer abuse: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # RUG PULL THREATS (CRITICAL)
     # ========================================================================
 
-    async def detect_honeypot(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_honeypot(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect honeypot (can buy but cannot sell)
 
@@ -250,10 +737,10 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting honeypot: {e}")
+            logger.error("Error detecting honeypot: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_rug_pull_imminent(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_rug_pull_imminent(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect imminent rug pull (multiple signals indicating rug about to happen)
 
@@ -351,10 +838,10 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting imminent rug pull: {e}")
+            logger.error("Error detecting imminent rug pull: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_liquidity_removal(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_liquidity_removal(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect liquidity removal (LP tokens being burned/withdrawn)
 
@@ -362,7 +849,7 @@ class ThreatDetectionMethods:
         """
         try:
             # Get current liquidity
-            current_liquidity = token_info.liquidity if hasattr(token_info, 'liquidity') else 0
+            current_liquidity = token_info.liquidity if token_info.liquidity is not None else 0
 
             # Get historical liquidity from cache or fetch
             historical_liquidity = await self._get_historical_liquidity(token_info)
@@ -405,31 +892,32 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting liquidity removal: {e}")
+            logger.error("Error detecting liquidity removal: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_creator_exit(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_creator_exit(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect creator exiting (selling their tokens)
 
         Returns: (severity, confidence, evidence) or None
         """
         try:
-            creator_address = getattr(token_info, 'creator', None)
+            creator_address = token_info.creator
             if not creator_address:
                 return None
 
             # Get creator's transaction history
-            creator_txs = await self._get_recent_transactions(creator_address, limit=50)
+            creator_txs = await self._get_recent_transactions(creator_address, limit=50, mint=token_info.mint)
 
             # Analyze transactions
-            sell_txs = [tx for tx in creator_txs if self._is_sell_transaction(tx, token_info.mint)]
+            sell_txs = creator_txs.where_action(ACTION_SELL)
 
             if not sell_txs:
                 return None
 
             # Calculate amount sold
-            total_sold = sum(self._get_transaction_amount(tx) for tx in sell_txs)
+            amounts = creator_txs.amount
+            total_sold = sum(amounts[i] for i in sell_txs)
 
             # Get creator's initial holdings
             initial_holdings = await self._estimate_creator_initial_holdings(token_info)
@@ -468,14 +956,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting creator exit: {e}")
+            logger.error("Error detecting creator exit: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # VOLUME & PATTERN THREATS
     # ========================================================================
 
-    async def detect_wash_trading(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_wash_trading(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect wash trading (same wallets buying and selling to fake volume)
 
@@ -483,50 +971,51 @@ class ThreatDetectionMethods:
         """
         try:
             # Get recent transactions
-            recent_txs = await self._get_token_transactions(token_info.mint, limit=200)
+            recent_txs = ctx.recent_txs
 
             if len(recent_txs) < 20:
                 return None  # Not enough data
 
-            # Build transaction graph
-            # wallet -> [(timestamp, "buy"/"sell", amount)]
-            wallet_activity: Dict[str, List[Tuple[float, str, float]]] = defaultdict(list)
-
-            for tx in recent_txs:
-                signer = self._get_transaction_signer(tx)
-                action = self._get_transaction_action(tx, token_info.mint)
-                amount = self._get_transaction_amount(tx)
-                timestamp = self._get_transaction_timestamp(tx)
-
-                wallet_activity[signer].append((timestamp, action, amount))
+            # Stable-sort the feature columns by wallet so each wallet's
+            # activity is one contiguous run
+            order = sorted(range(len(recent_txs)), key=recent_txs.signer_id.__getitem__)
+            wallet_idx = [recent_txs.signer_id[i] for i in order]
+            timestamps = [recent_txs.timestamp[i] for i in order]
+            actions = [recent_txs.action[i] for i in order]
+            amounts = [recent_txs.amount[i] for i in order]
+            wallets = recent_txs.signers
+            boundaries = [bisect_left(wallet_idx, w) for w in range(len(wallets) + 1)]
 
             # Detect wash trading patterns
             wash_trading_wallets = []
             wash_trading_volume = 0.0
 
-            for wallet, activities in wallet_activity.items():
-                # Check if wallet has both buys and sells
-                buy_actions = [a for a in activities if a[1] == "buy"]
-                sell_actions = [a for a in activities if a[1] == "sell"]
+            for w, wallet in enumerate(wallets):
+                lo, hi = boundaries[w], boundaries[w + 1]
+                wallet_actions = actions[lo:hi]
 
-                if not buy_actions or not sell_actions:
+                # Check if wallet has both buys and sells
+                if ACTION_BUY not in wallet_actions or ACTION_SELL not in wallet_actions:
                     continue
 
+                # [(timestamp, action, amount)] for this wallet
+                activities = list(zip(timestamps[lo:hi], wallet_actions, amounts[lo:hi]))
+
                 # Check for suspicious patterns:
                 # 1. Rapid buy-sell loops
                 # 2. Same amounts
                 # 3. Regular intervals
 
-                has_rapid_loops = self._check_rapid_buysell_loops(activities)
-                has_same_amounts = self._check_same_amounts(activities)
-                has_regular_intervals = self._check_regular_intervals(activities)
+                has_rapid_loops, has_same_amounts, has_regular_intervals = (
+                    self._analyze_activity_patterns(activities)
+                )
 
                 if sum([has_rapid_loops, has_same_amounts, has_regular_intervals]) >= 2:
                     wash_trading_wallets.append(wallet)
-                    wash_trading_volume += sum(a[2] for a in activities)
+                    wash_trading_volume += sum(amounts[lo:hi])
 
             if wash_trading_wallets:
-                wash_ratio = wash_trading_volume / token_info.volume_24h if token_info.volume_24h > 0 else 0
+                wash_ratio = wash_trading_volume / token_info.volume_24h if token_info.volume_24h is not None and token_info.volume_24h > 0 else 0
 
                 if wash_ratio > 0.50:  # >50% wash trading
                     return (
@@ -556,10 +1045,10 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting wash trading: {e}")
+            logger.error("Error detecting wash trading: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_pump_and_dump(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_pump_and_dump(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """
         Detect pump and dump pattern
 
@@ -587,7 +1076,7 @@ class ThreatDetectionMethods:
                 return None
 
             # Get recent volume
-            volume_recent = token_info.volume_24h if hasattr(token_info, 'volume_24h') else 0
+            volume_recent = token_info.volume_24h if token_info.volume_24h is not None else 0
             volume_baseline = await self._get_baseline_volume(token_info)
 
             volume_spike = volume_recent / volume_baseline if volume_baseline > 0 else 1.0
@@ -647,14 +1136,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting pump and dump: {e}")
+            logger.error("Error detecting pump and dump: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # TOKEN METADATA & MANIPULATION THREATS
     # ========================================================================
 
-    async def detect_token_metadata_manipulation(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_token_metadata_manipulation(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect suspicious token metadata manipulation."""
         try:
             # Check for metadata manipulation indicators
@@ -674,7 +1163,7 @@ class ThreatDetectionMethods:
             #     indicators.append("Possible impersonation")
 
             # Indicator 3: Suspicious URI or missing metadata
-            # metadata = await self._fetch_token_metadata(token_info.mint_address)
+            # metadata = ctx.metadata
             # if not metadata or not metadata.get("uri"):
             #     suspicion_score += 0.15
             #     indicators.append("Missing or suspicious metadata")
@@ -696,14 +1185,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting metadata manipulation: {e}")
+            logger.error("Error detecting metadata manipulation: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_freeze_authority_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_freeze_authority_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect if freeze authority exists and is risky."""
         try:
             # Check for freeze authority
-            # account_data = await self.client.get_account_info(token_info.mint_address)
+            # account_data = ctx.mint_account
             # freeze_authority = self._extract_freeze_authority(account_data)
 
             # if freeze_authority:
@@ -724,14 +1213,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting freeze authority risk: {e}")
+            logger.error("Error detecting freeze authority risk: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_mint_authority_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_mint_authority_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect if mint authority exists and poses dilution risk."""
         try:
             # Check for mint authority
-            # account_data = await self.client.get_account_info(token_info.mint_address)
+            # account_data = ctx.mint_account
             # mint_authority = self._extract_mint_authority(account_data)
 
             # if mint_authority:
@@ -750,246 +1239,219 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting mint authority risk: {e}")
+            logger.error("Error detecting mint authority risk: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # ORACLE THREATS
     # ========================================================================
 
-    async def detect_oracle_manipulation(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_oracle_manipulation(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect oracle price manipulation."""
         try:
-            # Get oracle prices from multiple sources
-            # oracle_prices = await self._fetch_oracle_prices(token_info.mint_address)
-            # dex_price = await self._fetch_dex_price(token_info.pool_address)
+            # Compare fresh oracle feeds against the DEX price
+            summary = ctx.oracle_summary
+            if summary is None or summary.max_deviation is None:
+                return None
 
             # Check for large deviation
-            # if oracle_prices and dex_price:
-            #     max_deviation = max(abs(p - dex_price) / dex_price for p in oracle_prices)
-            #     if max_deviation > 0.10:  # 10% deviation
-            #         return (
-            #             "high",
-            #             max_deviation,
-            #             {
-            #                 "oracle_prices": oracle_prices,
-            #                 "dex_price": dex_price,
-            #                 "deviation": f"{max_deviation:.1%}",
-            #                 "reason": "Oracle price manipulation detected"
-            #             }
-            #         )
+            max_deviation = summary.max_deviation
+            if max_deviation > 0.10:  # 10% deviation
+                return (
+                    "high",
+                    min(1.0, max_deviation),
+                    {
+                        "oracle_prices": list(summary.prices),
+                        "median_oracle_price": summary.median,
+                        "feed_divergence": f"{summary.divergence:.1%}",
+                        "dex_price": ctx.dex_price,
+                        "deviation": f"{max_deviation:.1%}",
+                        "reason": "Oracle price manipulation detected"
+                    }
+                )
 
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting oracle manipulation: {e}")
+            logger.error("Error detecting oracle manipulation: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_oracle_staleness(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_oracle_staleness(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect stale oracle data."""
         try:
-            # Check oracle last update time
-            # oracle_data = await self._fetch_oracle_data(token_info.mint_address)
-            # if oracle_data:
-            #     last_update = oracle_data.get("last_update_slot")
-            #     current_slot = await self.client.get_slot()
-            #     slots_since_update = current_slot - last_update
-            #
-            #     # If oracle hasn't updated in 100 slots (~1 minute)
-            #     if slots_since_update > 100:
-            #         staleness = min(1.0, slots_since_update / 1000)
-            #         return (
-            #             "medium",
-            #             staleness,
-            #             {
-            #                 "slots_stale": slots_since_update,
-            #                 "reason": "Oracle data is stale",
-            #                 "risk": "Price feeds may be outdated"
-            #             }
-            #         )
+            # Check oracle last update time, across the primary oracle
+            # account and every individual feed
+            ages = []
+            oracle_data = ctx.oracle_data
+            if oracle_data and ctx.current_slot is not None:
+                last_update = oracle_data.get("last_update_slot")
+                if last_update is not None:
+                    ages.append(ctx.current_slot - last_update)
+            if ctx.oracle_summary and ctx.oracle_summary.worst_stale_slots is not None:
+                ages.append(ctx.oracle_summary.worst_stale_slots)
+            if not ages:
+                return None
+
+            slots_since_update = max(ages)
+
+            # If oracle hasn't updated in 100 slots (~1 minute)
+            if slots_since_update > _ORACLE_STALE_SLOTS:
+                staleness = min(1.0, slots_since_update / 1000)
+                return (
+                    "medium",
+                    staleness,
+                    {
+                        "slots_stale": slots_since_update,
+                        "reason": "Oracle data is stale",
+                        "risk": "Price feeds may be outdated"
+                    }
+                )
 
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting oracle staleness: {e}")
+            logger.error("Error detecting oracle staleness: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # FLASH LOAN THREATS
     # ========================================================================
 
-    async def detect_flash_loan_vulnerability(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    @scored_detector(
+        checks=[
+            (0.40, "_uses_spot_price"),
+            (0.35, "_lacks_flash_loan_protection"),
+            (0.25, "_has_flash_loan_liquidity"),
+        ],
+        threshold=0.60,
+        severity="high",
+        score_label="vulnerability_score",
+        reason="Vulnerable to flash loan attacks",
+        risk="Price can be manipulated within a single transaction",
+    )
+    async def detect_flash_loan_vulnerability(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect vulnerability to flash loan attacks."""
-        try:
-            # Check if protocol relies on spot prices
-            # Check if protocol has flash loan protection
-            # vulnerability_score = 0.0
-
-            # # Check 1: Uses spot price without TWAP
-            # uses_spot_price = await self._check_uses_spot_price(token_info.pool_address)
-            # if uses_spot_price:
-            #     vulnerability_score += 0.40
-
-            # # Check 2: No flash loan protection
-            # has_protection = await self._check_flash_loan_protection(token_info.mint_address)
-            # if not has_protection:
-            #     vulnerability_score += 0.35
-
-            # # Check 3: Low liquidity (easier to manipulate)
-            # if token_info.liquidity_sol < 10.0:
-            #     vulnerability_score += 0.25
-
-            # if vulnerability_score >= 0.60:
-            #     return (
-            #         "high",
-            #         vulnerability_score,
-            #         {
-            #             "vulnerability_score": f"{vulnerability_score:.0%}",
-            #             "reason": "Vulnerable to flash loan attacks",
-            #             "risk": "Price can be manipulated within a single transaction"
-            #         }
-            #     )
-
-            return None
-
-        except Exception as e:
-            logger.exception(f"Error detecting flash loan vulnerability: {e}")
-            return None
 
     # ========================================================================
     # MEV THREATS
     # ========================================================================
 
-    async def detect_sandwich_attack_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    @scored_detector(
+        checks=[
+            (0.35, "_has_high_slippage"),
+            (0.30, "_has_sandwich_liquidity"),
+            (0.35, "_has_recent_sandwiches"),
+        ],
+        threshold=0.60,
+        severity="medium",
+        score_label="risk_score",
+        reason="High risk of sandwich attacks",
+        risk="MEV bots may front-run your trades",
+    )
+    async def detect_sandwich_attack_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect if token is susceptible to sandwich attacks."""
-        try:
-            # Check sandwich attack indicators
-            # risk_score = 0.0
-
-            # # High slippage = easier to sandwich
-            # if token_info.slippage > 0.05:  # >5% slippage
-            #     risk_score += 0.35
 
-            # # Low liquidity = easier to manipulate
-            # if token_info.liquidity_sol < 20.0:
-            #     risk_score += 0.30
-
-            # # Check recent sandwich attacks
-            # recent_sandwiches = await self._detect_recent_sandwich_attacks(token_info.mint_address)
-            # if recent_sandwiches:
-            #     risk_score += 0.35
-
-            # if risk_score >= 0.60:
-            #     return (
-            #         "medium",
-            #         risk_score,
-            #         {
-            #             "risk_score": f"{risk_score:.0%}",
-            #             "reason": "High risk of sandwich attacks",
-            #             "risk": "MEV bots may front-run your trades"
-            #         }
-            #     )
-
-            return None
-
-        except Exception as e:
-            logger.exception(f"Error detecting sandwich risk: {e}")
-            return None
+    async def detect_front_running_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
+        """
+        Detect front-running risk.
 
-    async def detect_front_running_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
-        """Detect front-running risk."""
+        Counts front-run/back-run pairs found by _find_sandwich_pairs in one
+        pass over block-ordered transactions.
+        """
         try:
-            # Check for front-running patterns
-            # recent_txs = await self._get_recent_transactions(token_info.mint_address, limit=100)
-            # front_run_count = 0
+            recent_txs = ctx.recent_txs
+            if len(recent_txs) < 3:
+                return None
 
-            # for i in range(1, len(recent_txs)):
-            #     if self._is_front_run(recent_txs[i-1], recent_txs[i]):
-            #         front_run_count += 1
+            front_run_count = len(self._detect_recent_sandwich_attacks(recent_txs))
+            risk = front_run_count / len(recent_txs)
 
-            # if front_run_count > 10:  # >10% of transactions are front-run
-            #     risk = front_run_count / len(recent_txs)
-            #     return (
-            #         "medium",
-            #         risk,
-            #         {
-            #             "front_runs_detected": front_run_count,
-            #             "total_txs": len(recent_txs),
-            #             "reason": "Active front-running detected",
-            #             "risk": "Your transactions may be front-run by MEV bots"
-            #         }
-            #     )
+            if risk > 0.10:  # >10% of transactions are front-run
+                return (
+                    "medium",
+                    risk,
+                    {
+                        "front_runs_detected": front_run_count,
+                        "total_txs": len(recent_txs),
+                        "reason": "Active front-running detected",
+                        "risk": "Your transactions may be front-run by MEV bots"
+                    }
+                )
 
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting front-running risk: {e}")
+            logger.error("Error detecting front-running risk: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # BONDING CURVE THREATS
     # ========================================================================
 
-    async def detect_bonding_curve_manipulation(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_bonding_curve_manipulation(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect bonding curve price manipulation."""
         try:
             # Check if bonding curve price deviates from expected
-            # if token_info.platform in ["pump_fun", "lets_bonk"]:
-            #     expected_price = await self._calculate_expected_curve_price(token_info)
-            #     actual_price = token_info.price
-            #
-            #     if expected_price:
-            #         deviation = abs(actual_price - expected_price) / expected_price
-            #         if deviation > 0.15:  # 15% deviation
-            #             return (
-            #                 "high",
-            #                 deviation,
-            #                 {
-            #                     "expected_price": expected_price,
-            #                     "actual_price": actual_price,
-            #                     "deviation": f"{deviation:.1%}",
-            #                     "reason": "Bonding curve manipulation detected"
-            #                 }
-            #             )
+            if token_info.platform not in _BONDING_CURVE_PLATFORMS:
+                return None
+
+            expected_price = await self._calculate_expected_curve_price(token_info)
+            actual_price = ctx.dex_price
+
+            if expected_price and actual_price:
+                deviation = abs(actual_price - expected_price) / expected_price
+                if deviation > 0.15:  # 15% deviation
+                    return (
+                        "high",
+                        min(1.0, deviation),
+                        {
+                            "expected_price": expected_price,
+                            "actual_price": actual_price,
+                            "deviation": f"{deviation:.1%}",
+                            "reason": "Bonding curve manipulation detected"
+                        }
+                    )
 
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting curve manipulation: {e}")
+            logger.error("Error detecting curve manipulation: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_curve_exhaustion(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_curve_exhaustion(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect if bonding curve is near exhaustion."""
         try:
             # Check if curve is near max capacity
-            # if token_info.platform in ["pump_fun", "lets_bonk"]:
-            #     curve_progress = await self._get_curve_progress(token_info.pool_address)
-            #     if curve_progress and curve_progress > 0.90:  # >90% complete
-            #         return (
-            #             "medium",
-            #             curve_progress,
-            #             {
-            #                 "progress": f"{curve_progress:.1%}",
-            #                 "reason": "Bonding curve near exhaustion",
-            #                 "info": "Token approaching Raydium migration"
-            #             }
-            #         )
+            if token_info.platform not in _BONDING_CURVE_PLATFORMS:
+                return None
+
+            curve_progress = await self._get_curve_progress(token_info)
+            if curve_progress and curve_progress > 0.90:  # >90% complete
+                return (
+                    "medium",
+                    curve_progress,
+                    {
+                        "progress": f"{curve_progress:.1%}",
+                        "reason": "Bonding curve near exhaustion",
+                        "info": "Token approaching Raydium migration"
+                    }
+                )
 
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting curve exhaustion: {e}")
+            logger.error("Error detecting curve exhaustion: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # GOVERNANCE THREATS
     # ========================================================================
 
-    async def detect_governance_attack_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_governance_attack_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect governance attack vulnerabilities."""
         try:
             # Check governance concentration
-            # governance_data = await self._fetch_governance_data(token_info.mint_address)
+            # governance_data = ctx.governance_data
             # if governance_data:
             #     top_voter_power = governance_data.get("top_10_voting_power", 0)
             #     if top_voter_power > 0.51:  # >51% concentration
@@ -1006,14 +1468,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting governance risk: {e}")
+            logger.error("Error detecting governance risk: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_proposal_manipulation(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_proposal_manipulation(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect suspicious governance proposals."""
         try:
             # Check for malicious proposals
-            # active_proposals = await self._fetch_active_proposals(token_info.mint_address)
+            # active_proposals = ctx.active_proposals
             # for proposal in active_proposals:
             #     # Check for suspicious changes
             #     if self._is_malicious_proposal(proposal):
@@ -1030,18 +1492,18 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting proposal manipulation: {e}")
+            logger.error("Error detecting proposal manipulation: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # SMART CONTRACT VULNERABILITIES
     # ========================================================================
 
-    async def detect_reentrancy_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_reentrancy_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect reentrancy vulnerability in smart contracts."""
         try:
             # Analyze contract for reentrancy patterns
-            # program_data = await self._fetch_program_data(token_info.mint_address)
+            # program_data = ctx.program_data
             # if program_data:
             #     has_reentrancy = await self._analyze_reentrancy_patterns(program_data)
             #     if has_reentrancy:
@@ -1057,14 +1519,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting reentrancy: {e}")
+            logger.error("Error detecting reentrancy: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_integer_overflow_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_integer_overflow_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect integer overflow vulnerabilities."""
         try:
             # Check for unsafe arithmetic operations
-            # program_data = await self._fetch_program_data(token_info.mint_address)
+            # program_data = ctx.program_data
             # if program_data:
             #     has_overflow_risk = await self._analyze_arithmetic_safety(program_data)
             #     if has_overflow_risk:
@@ -1080,14 +1542,14 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting overflow risk: {e}")
+            logger.error("Error detecting overflow risk: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_access_control_issues(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_access_control_issues(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect access control vulnerabilities."""
         try:
             # Check for missing or weak access controls
-            # program_data = await self._fetch_program_data(token_info.mint_address)
+            # program_data = ctx.program_data
             # if program_data:
             #     access_issues = await self._analyze_access_controls(program_data)
             #     if access_issues:
@@ -1104,54 +1566,57 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting access control issues: {e}")
+            logger.error("Error detecting access control issues: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # SOCIAL ENGINEERING THREATS
     # ========================================================================
 
-    async def detect_phishing_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_phishing_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect phishing attempts through token metadata."""
         try:
             # Check for phishing indicators in metadata
-            # metadata = await self._fetch_token_metadata(token_info.mint_address)
-            # if metadata:
-            #     phishing_indicators = []
-            #
-            #     # Check for suspicious URLs
-            #     if "website" in metadata:
-            #         if self._is_suspicious_url(metadata["website"]):
-            #             phishing_indicators.append("Suspicious website URL")
-            #
-            #     # Check for urgent/scam language
-            #     description = metadata.get("description", "")
-            #     scam_keywords = ["urgent", "airdrop", "claim now", "limited time"]
-            #     if any(kw in description.lower() for kw in scam_keywords):
-            #         phishing_indicators.append("Scam language detected")
-            #
-            #     if phishing_indicators:
-            #         return (
-            #             "high",
-            #             0.80,
-            #             {
-            #                 "indicators": phishing_indicators,
-            #                 "reason": "Phishing attempt detected",
-            #                 "risk": "Token may be phishing scam"
-            #             }
-            #         )
+            metadata = ctx.metadata
+            if not metadata:
+                return None
+
+            phishing_indicators = []
+
+            # Check for suspicious URLs
+            if "website" in metadata:
+                if self._is_suspicious_url(metadata["website"]):
+                    phishing_indicators.append("Suspicious website URL")
+
+            # Check for urgent/scam language (one scan for all keywords)
+            description = metadata.get("description") or ""
+            scam_hits = set(_SCAM_KEYWORD_PATTERN.findall(description.lower()))
+            if scam_hits:
+                phishing_indicators.append("Scam language detected")
+
+            if phishing_indicators:
+                return (
+                    "high",
+                    0.80,
+                    {
+                        "indicators": phishing_indicators,
+                        "scam_keywords": sorted(scam_hits),
+                        "reason": "Phishing attempt detected",
+                        "risk": "Token may be phishing scam"
+                    }
+                )
 
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting phishing: {e}")
+            logger.error("Error detecting phishing: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    async def detect_wallet_drainer_risk(self, token_info: TokenInfo) -> Optional[Tuple[str, float, Dict]]:
+    async def detect_wallet_drainer_risk(self, token_info: TokenInfo, ctx: ThreatContext) -> Optional[Tuple[str, float, Dict]]:
         """Detect wallet drainer smart contracts."""
         try:
             # Check for wallet drainer patterns
-            # program_data = await self._fetch_program_data(token_info.mint_address)
+            # program_data = ctx.program_data
             # if program_data:
             #     is_drainer = await self._analyze_drainer_patterns(program_data)
             #     if is_drainer:
@@ -1168,29 +1633,191 @@ class ThreatDetectionMethods:
             return None
 
         except Exception as e:
-            logger.exception(f"Error detecting wallet drainer: {e}")
+            logger.error("Error detecting wallet drainer: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     # ========================================================================
     # HELPER METHODS (Placeholders - would have real implementation)
     # ========================================================================
 
+    # Weighted checks for @scored_detector detectors
+
+    async def _uses_spot_price(self, token_info: TokenInfo, ctx: ThreatContext) -> bool:
+        """Uses spot price without TWAP"""
+        return await self._check_uses_spot_price(token_info)
+
+    async def _lacks_flash_loan_protection(self, token_info: TokenInfo, ctx: ThreatContext) -> bool:
+        """No flash loan protection"""
+        return not await self._check_flash_loan_protection(token_info)
+
+    async def _has_flash_loan_liquidity(self, token_info: TokenInfo, ctx: ThreatContext) -> bool:
+        """Low liquidity (easier to manipulate)"""
+        return token_info.liquidity is not None and token_info.liquidity < 10.0
+
+    async def _has_high_slippage(self, token_info: TokenInfo, ctx: ThreatContext) -> bool:
+        """High slippage = easier to sandwich"""
+        slippage = await self._estimate_slippage(token_info)
+        return slippage is not None and slippage > 0.05  # >5% slippage
+
+    async def _has_sandwich_liquidity(self, token_info: TokenInfo, ctx: ThreatContext) -> bool:
+        """Low liquidity = easier to manipulate"""
+        return token_info.liquidity is not None and token_info.liquidity < 20.0
+
+    async def _has_recent_sandwiches(self, token_info: TokenInfo, ctx: ThreatContext) -> bool:
+        """Recent sandwich attacks on this token"""
+        return bool(self._detect_recent_sandwich_attacks(ctx.recent_txs))
+
+    def _find_extension(self, account_data: bytes, extension_name: str) -> Optional[memoryview]:
+        """
+        Locate a Token-2022 extension's value in mint account data
+
+        Walks the TLV headers over a memoryview, so no intermediate bytes
+        objects are created while stepping through the entries.
+        """
+        extension_type = _TOKEN_2022_EXTENSION_TYPES.get(extension_name)
+        if extension_type is None:
+            return None
+
+        view = memoryview(account_data)
+        end = len(view)
+        offset = _TOKEN_2022_TLV_START
+        header_size = _TLV_HEADER.size
+        unpack_from = _TLV_HEADER.unpack_from
+
+        while offset + header_size <= end:
+            tlv_type, length = unpack_from(view, offset)
+            offset += header_size
+            if tlv_type == extension_type:
+                return view[offset:offset + length]
+            if tlv_type == 0:  # Uninitialized: no more extensions
+                break
+            offset += length
+
+        return None
+
     def _check_extension_present(self, account_data: bytes, extension_name: str) -> bool:
-        """Check if Token-2022 extension is present (placeholder)"""
-        # Would parse account data to check for extension
+        """Check if Token-2022 extension is present"""
+        return self._find_extension(account_data, extension_name) is not None
+
+    async def current_slot(self) -> int:
+        """Get current slot, shared by all detectors and cached for _SLOT_TTL per RPC endpoint"""
+        return await _cached(_SLOT_CACHE, self.client.rpc_endpoint, self.client.get_slot, _SLOT_TTL)
+
+    async def _fetch_program_data(self, mint: Pubkey) -> Optional[bytes]:
+        """Fetch the mint's account data, cached for _PROGRAM_TTL per mint"""
+        return await _cached(_PROGRAM_CACHE, str(mint), lambda: self._load_program_data(mint), _PROGRAM_TTL)
+
+    async def _fetch_oracle_data(self, mint: Pubkey) -> Optional[Dict]:
+        """Fetch oracle data, cached until the slot advances"""
+        slot = await self.current_slot()
+        key = (str(mint), slot // _ORACLE_SLOT_BUCKET)
+        return await _cached(_ORACLE_CACHE, key, lambda: self._load_oracle_data(mint), None)
+
+    async def _fetch_oracle_prices(self, mint: Pubkey) -> List[Tuple[float, int]]:
+        """Fetch (price, last_update_slot) from all oracle sources concurrently"""
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(self._fetch_source(source, mint), _ORACLE_SOURCE_TIMEOUT)
+                for source in self.oracle_sources
+            ),
+            return_exceptions=True,
+        )
+
+        feeds = []
+        for source, result in zip(self.oracle_sources, results):
+            if isinstance(result, BaseException):
+                logger.debug("Oracle source %s failed: %s", source, result)
+                continue
+            if result is not None and result[0] > 0:
+                feeds.append(result)
+        return feeds
+
+    async def _fetch_source(self, source: str, mint: Pubkey) -> Optional[Tuple[float, int]]:
+        """Fetch (price, last_update_slot) from a single oracle source (placeholder)"""
+        return None
+
+    async def _calculate_expected_curve_price(self, token_info: TokenInfo) -> Optional[float]:
+        """Price implied by the bonding curve formula at current supply (placeholder)"""
+        return None
+
+    async def _get_curve_progress(self, token_info: TokenInfo) -> Optional[float]:
+        """Fraction of the bonding curve already filled (placeholder)"""
+        return None
+
+    async def _check_uses_spot_price(self, token_info: TokenInfo) -> bool:
+        """Check if the pool prices off spot rather than a TWAP (placeholder)"""
         return False
 
-    def _extract_hook_program(self, account_data: bytes) -> Optional[Pubkey]:
-        """Extract transfer hook program address (placeholder)"""
+    async def _check_flash_loan_protection(self, token_info: TokenInfo) -> bool:
+        """Check if the protocol guards against same-transaction manipulation (placeholder)"""
+        return True
+
+    async def _estimate_slippage(self, token_info: TokenInfo) -> Optional[float]:
+        """Expected slippage for a typical trade size (placeholder)"""
+        return None
+
+    def _detect_recent_sandwich_attacks(self, txs: TxBatch) -> List[Tuple[int, int]]:
+        """Find (front, back) sandwich pairs in recent transactions"""
+        if len(txs) < 3:
+            return []
+        ordered = txs.block_order()
+        return _find_sandwich_pairs(
+            [txs.slot[i] for i in ordered],
+            [txs.signer_id[i] for i in ordered],
+            [txs.action[i] for i in ordered],
+        )
+
+    async def _fetch_dex_price(self, token_info: TokenInfo) -> Optional[float]:
+        """Fetch current DEX/bonding-curve price (placeholder)"""
+        return None
+
+    async def _load_program_data(self, mint: Pubkey) -> Optional[bytes]:
+        """Load program data from RPC, batched with concurrent scans"""
+        fetcher = _BATCH_FETCHERS.get(self.client)
+        if fetcher is None:
+            fetcher = _BATCH_FETCHERS[self.client] = _BatchProgramFetcher(self.client)
+        return await fetcher.fetch(mint)
+
+    async def _load_oracle_data(self, mint: Pubkey) -> Optional[Dict]:
+        """Load oracle account data for the token from RPC (placeholder)"""
         return None
 
+    async def _fetch_token_metadata(self, mint: Pubkey) -> Optional[Dict]:
+        """Fetch off-chain token metadata (placeholder; parse the body with _parse_token_metadata)"""
+        return None
+
+    def _is_suspicious_url(self, url: str) -> bool:
+        """Check URL against all phishing tokens and patterns in one scan"""
+        return _SUSPICIOUS_URL_PATTERN.search(str(url)) is not None
+
+    async def _fetch_governance_data(self, mint: Pubkey) -> Optional[Dict]:
+        """Fetch governance voting power distribution (placeholder)"""
+        return None
+
+    async def _fetch_active_proposals(self, mint: Pubkey) -> List[Dict]:
+        """Fetch active governance proposals (placeholder)"""
+        return []
+
+    def _extract_hook_program(self, account_data: bytes) -> Optional[Pubkey]:
+        """Extract transfer hook program address"""
+        # TransferHook value: authority (32 bytes), program_id (32 bytes)
+        value = self._find_extension(account_data, "TransferHook")
+        if value is None or len(value) < 64:
+            return None
+        program_id = bytes(value[32:64])
+        return None if program_id == _EMPTY_PUBKEY else Pubkey.from_bytes(program_id)
+
     async def _analyze_hook_program(self, program_address: Optional[Pubkey]) -> bool:
         """Analyze if hook program is malicious (placeholder)"""
         return False
 
     def _extract_permanent_delegate(self, account_data: bytes) -> Optional[Pubkey]:
-        """Extract permanent delegate address (placeholder)"""
-        return None
+        """Extract permanent delegate address"""
+        value = self._find_extension(account_data, "PermanentDelegate")
+        if value is None or len(value) < 32:
+            return None
+        delegate = bytes(value[:32])
+        return None if delegate == _EMPTY_PUBKEY else Pubkey.from_bytes(delegate)
 
     async def _simulate_sell_transaction(self, token_address: Pubkey) -> Optional[Dict]:
         """Simulate a sell transaction to test if it works (placeholder)"""
@@ -1236,49 +1863,68 @@ class ThreatDetectionMethods:
         """Get historical liquidity data (placeholder)"""
         return []
 
-    async def _get_recent_transactions(self, address: Pubkey, limit: int = 50) -> List:
-        """Get recent transactions for address (placeholder)"""
-        return []
-
-    def _is_sell_transaction(self, tx: Any, mint: Pubkey) -> bool:
-        """Check if transaction is a sell (placeholder)"""
-        return False
-
-    def _get_transaction_amount(self, tx: Any) -> float:
-        """Get transaction amount (placeholder)"""
-        return 0.0
+    async def _get_recent_transactions(self, address: Pubkey, limit: int = 50, mint: Optional[Pubkey] = None) -> TxBatch:
+        """Get recent transactions for address, actions relative to mint (placeholder)"""
+        return TxBatch()
 
     async def _estimate_creator_initial_holdings(self, token_info: TokenInfo) -> float:
         """Estimate creator's initial holdings (placeholder)"""
         return 0.0
 
-    async def _get_token_transactions(self, mint: Pubkey, limit: int = 200) -> List:
+    async def _get_token_transactions(self, mint: Pubkey, limit: int = 200) -> TxBatch:
         """Get token transactions (placeholder)"""
-        return []
-
-    def _get_transaction_signer(self, tx: Any) -> str:
-        """Get transaction signer (placeholder)"""
-        return ""
-
-    def _get_transaction_action(self, tx: Any, mint: Pubkey) -> str:
-        """Get transaction action (buy/sell) (placeholder)"""
-        return ""
+        return TxBatch()
 
-    def _get_transaction_timestamp(self, tx: Any) -> float:
-        """Get transaction timestamp (placeholder)"""
-        return time.time()
-
-    def _check_rapid_buysell_loops(self, activities: List) -> bool:
-        """Check for rapid buy-sell loops (placeholder)"""
-        return False
+    def _analyze_activity_patterns(self, activities: List[Tuple[float, int, float]]) -> Tuple[bool, bool, bool]:
+        """
+        Check one wallet's (timestamp, action, amount) activity for wash patterns
 
-    def _check_same_amounts(self, activities: List) -> bool:
-        """Check if activities have same amounts (placeholder)"""
-        return False
+        Single pass with running state for all three checks; interval
+        variance is accumulated with Welford's algorithm.
 
-    def _check_regular_intervals(self, activities: List) -> bool:
-        """Check if activities at regular intervals (placeholder)"""
-        return False
+        Returns: (rapid_buysell_loops, same_amounts, regular_intervals)
+        """
+        rapid_flips = 0
+        amount_counts: Dict[float, int] = {}
+        max_same = 0
+        n_intervals = 0
+        mean_interval = 0.0
+        m2 = 0.0
+        prev_ts: Optional[float] = None
+        prev_action: Optional[int] = None
+
+        for ts, action, amount in activities:
+            # Same amounts
+            key = round(amount, 6)
+            count = amount_counts.get(key, 0) + 1
+            amount_counts[key] = count
+            if count > max_same:
+                max_same = count
+
+            if prev_ts is not None:
+                interval = abs(ts - prev_ts)
+
+                # Rapid buy-sell loops
+                if action != prev_action and interval <= _WASH_RAPID_WINDOW:
+                    rapid_flips += 1
+
+                # Regular intervals (Welford running mean/variance)
+                n_intervals += 1
+                delta = interval - mean_interval
+                mean_interval += delta / n_intervals
+                m2 += delta * (interval - mean_interval)
+
+            prev_ts = ts
+            prev_action = action
+
+        has_rapid_loops = rapid_flips >= _WASH_MIN_RAPID_FLIPS
+        has_same_amounts = max_same >= 3 and max_same >= len(activities) / 2
+        has_regular_intervals = False
+        if n_intervals >= 3 and mean_interval > 0:
+            std_interval = (m2 / n_intervals) ** 0.5
+            has_regular_intervals = std_interval / mean_interval <= _WASH_MAX_INTERVAL_CV
+
+        return has_rapid_loops, has_same_amounts, has_regular_intervals
 
     async def _get_price_history(self, token_info: TokenInfo, hours: int = 24) -> List[Dict]:
         """Get price history (placeholder)"""
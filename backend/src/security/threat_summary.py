@@ -0,0 +1,95 @@
+"""
+Incremental threat summary shared by the security detectors.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+
+class ThreatListView(Sequence):
+    """Read-only view of the first ``length`` entries of an append-only list.
+
+    The cache only ever appends to (or replaces) its list, so the prefix a
+    view covers never changes and a view stays valid after later calls.
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items: list[dict[str, Any]], length: int) -> None:
+        self._items = items
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return islice(self._items, self._length)
+
+    def __repr__(self) -> str:
+        return f"ThreatListView({list(self)!r})"
+
+
+class ThreatSummaryCache:
+    """Serializes a detector's append-only threat list incrementally.
+
+    Only threats appended since the previous call are serialized, into an
+    internal append-only list. The "threats" entry of the summary is a
+    read-only ThreatListView over that list, so a call costs O(new threats).
+    The dicts are shared between calls and must be treated as read-only.
+    """
+
+    __slots__ = ("_counts", "_serialize", "_threats")
+
+    def __init__(self, serialize: Callable[[Any], dict[str, Any]]) -> None:
+        """Initialize the cache.
+
+        Args:
+            serialize: Converts one threat into its summary dict
+        """
+        self._serialize = serialize
+        self._threats: list[dict[str, Any]] = []
+        self._counts: Counter = Counter()
+
+    def summarize(self, detected_threats: Sequence[Any]) -> dict[str, Any]:
+        """Build the summary for the detector's current threat list.
+
+        Args:
+            detected_threats: The detector's threat list
+
+        Returns:
+            Summary dictionary with threat counts and details
+        """
+        done = len(self._threats)
+        if len(detected_threats) < done:
+            # The threat list was reset externally: rebuild from scratch.
+            # A new list, so views handed out earlier keep their entries.
+            self._threats = []
+            self._counts = Counter()
+            done = 0
+
+        if len(detected_threats) > done:
+            new = detected_threats[done:]
+            self._counts.update(t.severity for t in new)
+            self._threats.extend(map(self._serialize, new))
+
+        counts = self._counts
+        total = len(self._threats)
+        return {
+            "total_threats": total,
+            "critical": counts["critical"],
+            "high": counts["high"],
+            "medium": counts["medium"],
+            "low": counts["low"],
+            "threats": ThreatListView(self._threats, total),
+        }
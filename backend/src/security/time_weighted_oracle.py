@@ -5,18 +5,40 @@ This module identifies time-weighted average price (TWAP) manipulation attacks.
 """
 
 import asyncio
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from itertools import accumulate, chain
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
+from security.threat_summary import ThreatSummaryCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-oracle price history is a fixed-size ring of C floats (float32): oracle
+# prices carry well under 7 significant digits of signal, and the kernels
+# accumulate in Python floats (float64), so halving the storage is free
+_MAX_PRICE_HISTORY = 4096
+_PRICE_TYPECODE = "f"
 
-@dataclass
+# Streaming TWAP check: EWMA smoothing factor, alert band in standard
+# deviations, and samples required before the variance is trusted
+_EWMA_ALPHA = 0.1
+_EWMA_BAND = 4.0
+_EWMA_WARMUP = 20
+
+# Minimum price history each batch detector needs (scan_oracle gates on these)
+_MIN_HISTORY_MULTI_BLOCK = 10
+_MIN_HISTORY_SKEW = 30
+_MIN_HISTORY_LONG_TAIL = 100
+_MIN_HISTORY_TWAP = 20
+
+
+@dataclass(slots=True)
 class OracleThreat:
     """Represents a detected oracle manipulation threat."""
 
@@ -30,6 +52,94 @@ class OracleThreat:
     confidence: float = 0.0  # 0.0 to 1.0
 
 
+def _serialize_threat(t: OracleThreat) -> Dict[str, Any]:
+    """Convert a threat into its get_threat_summary entry."""
+    return {
+        "type": t.threat_type,
+        "severity": t.severity,
+        "description": t.description,
+        "confidence": t.confidence,
+        "price_skew": t.price_skew_percentage,
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class _PriceSeries:
+    """Derived series shared by all detectors, computed once per scan."""
+
+    prices: Sequence[float]
+    changes: List[float]  # |p[i+1] - p[i]| / p[i], 0.0 where p[i] <= 0
+    cumsum: List[float]  # cumsum[i] == sum(prices[:i])
+    twap: float
+
+
+def _price_series(prices: Sequence[float]) -> _PriceSeries:
+    """Compute per-block changes, prefix sums and TWAP for a price history."""
+    cumsum = list(accumulate(prices, initial=0.0))
+    return _PriceSeries(
+        prices=prices,
+        # A non-positive price has no relative change; keep the slot so
+        # changes stays index-aligned with prices
+        changes=[
+            abs(curr - prev) / prev if prev > 0 else 0.0
+            for prev, curr in zip(prices, prices[1:])
+        ],
+        cumsum=cumsum,
+        twap=cumsum[-1] / len(prices) if prices else 0.0,
+    )
+
+
+def _mb_kernel(changes: Sequence[float], window: int) -> List[float]:
+    """Cumulative change of every window that looks like multi-block manipulation.
+
+    A window is flagged when its summed per-block change exceeds 5% while no
+    single block moves more than 1%. Runs in O(N) with a running sum and a
+    monotonic deque of indices whose changes are decreasing (front is the max).
+    """
+    flagged: List[float] = []
+    cumulative = 0.0
+    max_window: Deque[int] = deque()
+    for end in range(len(changes) - 1):
+        change = changes[end]
+        cumulative += change
+        while max_window and changes[max_window[-1]] <= change:
+            max_window.pop()
+        max_window.append(end)
+
+        start = end - window + 1
+        if start < 0:
+            continue
+        if start > 0:
+            cumulative -= changes[start - 1]
+        if max_window[0] < start:
+            max_window.popleft()
+
+        if cumulative > 0.05 and changes[max_window[0]] < 0.01:
+            flagged.append(cumulative)
+    return flagged
+
+
+def _skew_kernel(series: _PriceSeries, window: int) -> List[float]:
+    """Relative deviation of each price from the moving average of the preceding window.
+
+    Window averages come from the shared prefix sums in O(1) each.
+    """
+    prices = series.prices
+    cumsum = series.cumsum
+    deviations: List[float] = []
+    for i in range(window, len(prices)):
+        avg = (cumsum[i] - cumsum[i - window]) / window
+        deviations.append(abs(prices[i] - avg) / avg)
+    return deviations
+
+
+def _twap_kernel(series: _PriceSeries) -> float:
+    """Relative deviation of the last 10 prices from the full-history TWAP."""
+    cumsum = series.cumsum
+    recent_avg = (cumsum[-1] - cumsum[-11]) / 10
+    return abs(recent_avg - series.twap) / series.twap
+
+
 class TimeWeightedOracleScanner:
     """
     Detects time-weighted oracle manipulation including:
@@ -47,7 +157,12 @@ class TimeWeightedOracleScanner:
         """
         self.client = client
         self.detected_threats: List[OracleThreat] = []
-        self.price_history: Dict[str, List[float]] = {}  # oracle -> price history
+        self._summary = ThreatSummaryCache(_serialize_threat)
+        # oracle -> (ring buffer, total prices written)
+        self.price_history: Dict[str, Tuple[array, int]] = {}
+        # oracle -> exponentially weighted mean / variance of its price
+        self.ewma: Dict[str, float] = {}
+        self.ewma_var: Dict[str, float] = {}
 
     async def scan_oracle(
         self, oracle_address: Pubkey, lookback_blocks: int = 100
@@ -61,74 +176,141 @@ class TimeWeightedOracleScanner:
         Returns:
             List of detected threats
         """
-        logger.info(f"Scanning oracle: {oracle_address} (last {lookback_blocks} blocks)")
+        # Base58-encode the address once; every detector and threat reuses it
+        oracle_str = str(oracle_address)
+        logger.info(f"Scanning oracle: {oracle_str} (last {lookback_blocks} blocks)")
 
         threats: List[OracleThreat] = []
 
         # Get price history
-        price_history = await self._get_price_history(oracle_address, lookback_blocks)
+        price_history = await self._get_price_history(oracle_str, lookback_blocks)
+
+        # Gate every detector on history length before deriving anything, so
+        # short (or empty) histories cost only a few integer comparisons.
+        # Multi-block has the smallest minimum, so it guards the whole block.
+        n = len(price_history)
+        if n >= _MIN_HISTORY_MULTI_BLOCK:
+            # Derive changes, prefix sums and TWAP once; detectors index into them
+            series = _price_series(price_history)
+
+            # Detectors are pure CPU over the shared series: call them directly
+            threats.extend(self._detect_multi_block_manipulation(oracle_str, series))
+            if n >= _MIN_HISTORY_SKEW:
+                threats.extend(self._detect_gradual_price_skew(oracle_str, series))
+            if n >= _MIN_HISTORY_LONG_TAIL:
+                threats.extend(self._detect_long_tail_poisoning(oracle_str, series))
+            if n >= _MIN_HISTORY_TWAP:
+                threats.extend(self._detect_twap_manipulation(oracle_str, series))
 
-        # Detect multi-block manipulation
-        multi_block_threats = await self._detect_multi_block_manipulation(
-            oracle_address, price_history
-        )
-        threats.extend(multi_block_threats)
+        self.detected_threats.extend(threats)
+        logger.info(f"Detected {len(threats)} oracle manipulation threats")
 
-        # Detect gradual price skew
-        skew_threats = await self._detect_gradual_price_skew(
-            oracle_address, price_history
-        )
-        threats.extend(skew_threats)
+        return threats
+
+    def observe_price(self, oracle_key: str, price: float) -> Optional[OracleThreat]:
+        """Record a new oracle price and run the O(1) streaming TWAP check.
+
+        The price is compared against the exponentially weighted mean and
+        variance accumulated so far; a move outside ``_EWMA_BAND`` standard
+        deviations is reported as TWAP manipulation. ``scan_oracle``'s batch
+        TWAP detector remains the fallback for oracles without a warm EWMA.
 
-        # Detect long-tail poisoning
-        poisoning_threats = await self._detect_long_tail_poisoning(
-            oracle_address, price_history
+        Args:
+            oracle_key: Oracle address as a string
+            price: Observed oracle price
+
+        Returns:
+            Detected threat, or None
+        """
+        self._append_price(oracle_key, price)
+
+        mean = self.ewma.get(oracle_key)
+        if mean is None:
+            self.ewma[oracle_key] = price
+            self.ewma_var[oracle_key] = 0.0
+            return None
+
+        variance = self.ewma_var[oracle_key]
+        diff = price - mean
+        self.ewma[oracle_key] = mean + _EWMA_ALPHA * diff
+        self.ewma_var[oracle_key] = (
+            _EWMA_ALPHA * diff * diff + (1 - _EWMA_ALPHA) * variance
         )
-        threats.extend(poisoning_threats)
 
-        # Detect TWAP manipulation
-        twap_threats = await self._detect_twap_manipulation(
-            oracle_address, price_history
+        # A non-positive mean has no relative deviation (zero prices are
+        # skipped the same way by the batch series)
+        if (
+            self.price_history[oracle_key][1] <= _EWMA_WARMUP
+            or mean <= 0
+            or abs(diff) <= _EWMA_BAND * variance**0.5
+        ):
+            return None
+
+        deviation = abs(diff) / mean
+        threat = OracleThreat(
+            threat_type="twap_manipulation",
+            severity="high",
+            description=f"Detected TWAP manipulation: {deviation*100:.2f}% deviation from EWMA",
+            oracle_address=oracle_key,
+            price_skew_percentage=deviation * 100,
+            confidence=0.75,
         )
-        threats.extend(twap_threats)
+        self.detected_threats.append(threat)
+        logger.warning(
+            f"Streaming TWAP manipulation detected on {oracle_key}: {deviation*100:.2f}% from EWMA"
+        )
+        return threat
 
-        self.detected_threats.extend(threats)
-        logger.info(f"Detected {len(threats)} oracle manipulation threats")
+    def _append_price(self, oracle_key: str, price: float) -> None:
+        """Record the latest price for an oracle in its ring buffer.
 
-        return threats
+        Args:
+            oracle_key: Oracle address as a string
+            price: Observed oracle price
+        """
+        entry = self.price_history.get(oracle_key)
+        if entry is None:
+            buf, head = array(_PRICE_TYPECODE, [0.0]) * _MAX_PRICE_HISTORY, 0
+        else:
+            buf, head = entry
+        buf[head % _MAX_PRICE_HISTORY] = price
+        self.price_history[oracle_key] = (buf, head + 1)
 
     async def _get_price_history(
-        self, oracle_address: Pubkey, lookback_blocks: int
-    ) -> List[float]:
+        self, oracle_str: str, lookback_blocks: int
+    ) -> Sequence[float]:
         """Get price history for an oracle.
 
         Args:
-            oracle_address: Oracle address
+            oracle_str: Oracle address as a string
             lookback_blocks: Number of blocks to look back
 
         Returns:
             List of historical prices
         """
-        try:
-            # In production, this would:
-            # 1. Fetch historical oracle updates
-            # 2. Extract prices from each update
-            # 3. Return ordered list of prices
-
-            oracle_key = str(oracle_address)
-
-            if oracle_key in self.price_history:
-                return self.price_history[oracle_key][-lookback_blocks:]
-
+        # In production, this would:
+        # 1. Fetch historical oracle updates
+        # 2. Extract prices from each update
+        # 3. Return ordered list of prices
+        # Errors from that RPC fetch should be handled at the fetch itself;
+        # the ring-buffer read below cannot raise.
+
+        entry = self.price_history.get(oracle_str)
+        if entry is None:
             # Placeholder - would fetch from RPC
             return []
 
-        except Exception as e:
-            logger.exception(f"Error fetching price history: {e}")
-            return []
-
-    async def _detect_multi_block_manipulation(
-        self, oracle_address: Pubkey, price_history: List[float]
+        buf, head = entry
+        count = min(lookback_blocks, head, _MAX_PRICE_HISTORY)
+        start = (head - count) % _MAX_PRICE_HISTORY
+        end = start + count
+        if end <= _MAX_PRICE_HISTORY:
+            return buf[start:end]
+        # Window wraps around the end of the ring: stitch both halves
+        return buf[start:] + buf[: end - _MAX_PRICE_HISTORY]
+
+    def _detect_multi_block_manipulation(
+        self, oracle_str: str, series: _PriceSeries
     ) -> List[OracleThreat]:
         """Detect multi-block price manipulation.
 
@@ -138,8 +320,9 @@ class TimeWeightedOracleScanner:
         3. Achieves significant cumulative skew
 
         Args:
-            oracle_address: Oracle address
-            price_history: Historical prices
+            oracle_str: Oracle address as a string
+            series: Price history with its derived series
+                (at least _MIN_HISTORY_MULTI_BLOCK prices)
 
         Returns:
             List of detected multi-block manipulation threats
@@ -147,51 +330,37 @@ class TimeWeightedOracleScanner:
         threats: List[OracleThreat] = []
 
         try:
-            if len(price_history) < 10:
-                return threats
-
-            # Calculate price changes over blocks
-            price_changes = [
-                abs(price_history[i] - price_history[i - 1])
-                / price_history[i - 1]
-                for i in range(1, len(price_history))
-            ]
-
             # Detect gradual manipulation (small changes over many blocks)
             window_size = 20
-            for i in range(window_size, len(price_changes)):
-                window_changes = price_changes[i - window_size : i]
-                cumulative_change = sum(window_changes)
-
-                # If cumulative change is significant but individual changes are small
-                if cumulative_change > 0.05 and max(window_changes) < 0.01:
-                    threat = OracleThreat(
-                        threat_type="multi_block_manipulation",
-                        severity="high",
-                        description=f"Detected gradual price manipulation over {window_size} blocks",
-                        oracle_address=str(oracle_address),
-                        manipulation_duration=window_size,
-                        price_skew_percentage=cumulative_change * 100,
-                        confidence=0.7,
-                    )
-                    threats.append(threat)
-                    logger.warning(
-                        f"Multi-block manipulation detected: {cumulative_change*100:.2f}% skew over {window_size} blocks"
-                    )
+            for cumulative_change in _mb_kernel(series.changes, window_size):
+                threat = OracleThreat(
+                    threat_type="multi_block_manipulation",
+                    severity="high",
+                    description=f"Detected gradual price manipulation over {window_size} blocks",
+                    oracle_address=oracle_str,
+                    manipulation_duration=window_size,
+                    price_skew_percentage=cumulative_change * 100,
+                    confidence=0.7,
+                )
+                threats.append(threat)
+                logger.warning(
+                    f"Multi-block manipulation detected: {cumulative_change*100:.2f}% skew over {window_size} blocks"
+                )
 
         except Exception as e:
             logger.exception(f"Error detecting multi-block manipulation: {e}")
 
         return threats
 
-    async def _detect_gradual_price_skew(
-        self, oracle_address: Pubkey, price_history: List[float]
+    def _detect_gradual_price_skew(
+        self, oracle_str: str, series: _PriceSeries
     ) -> List[OracleThreat]:
         """Detect gradual price skew attacks.
 
         Args:
-            oracle_address: Oracle address
-            price_history: Historical prices
+            oracle_str: Oracle address as a string
+            series: Price history with its derived series
+                (at least _MIN_HISTORY_SKEW prices)
 
         Returns:
             List of detected gradual skew threats
@@ -199,39 +368,38 @@ class TimeWeightedOracleScanner:
         threats: List[OracleThreat] = []
 
         try:
-            if len(price_history) < 30:
-                return threats
-
-            # Calculate moving average
+            # Detect if price is consistently deviating from moving average.
+            # Consecutive deviating samples collapse into one threat carrying
+            # the run's peak; the trailing 0.0 closes a run at the end.
             window = 10
-            moving_avg = [
-                sum(price_history[i - window : i]) / window
-                for i in range(window, len(price_history))
-            ]
-
-            # Detect if price is consistently deviating from moving average
-            for i, price in enumerate(price_history[window:]):
-                avg = moving_avg[i]
-                deviation = abs(price - avg) / avg
-
+            run_length = 0
+            peak_deviation = 0.0
+            for deviation in chain(_skew_kernel(series, window), (0.0,)):
                 if deviation > 0.03:  # 3% deviation
+                    run_length += 1
+                    peak_deviation = max(peak_deviation, deviation)
+                    continue
+                if run_length:
                     threat = OracleThreat(
                         threat_type="gradual_price_skew",
                         severity="medium",
-                        description=f"Detected gradual price skew: {deviation*100:.2f}% deviation from average",
-                        oracle_address=str(oracle_address),
-                        price_skew_percentage=deviation * 100,
+                        description=f"Detected gradual price skew: {peak_deviation*100:.2f}% peak deviation from average over {run_length} blocks",
+                        oracle_address=oracle_str,
+                        manipulation_duration=run_length,
+                        price_skew_percentage=peak_deviation * 100,
                         confidence=0.6,
                     )
                     threats.append(threat)
+                    run_length = 0
+                    peak_deviation = 0.0
 
         except Exception as e:
             logger.exception(f"Error detecting gradual price skew: {e}")
 
         return threats
 
-    async def _detect_long_tail_poisoning(
-        self, oracle_address: Pubkey, price_history: List[float]
+    def _detect_long_tail_poisoning(
+        self, oracle_str: str, series: _PriceSeries
     ) -> List[OracleThreat]:
         """Detect long-tail poisoning attacks.
 
@@ -241,8 +409,9 @@ class TimeWeightedOracleScanner:
         3. Achieves significant cumulative effect
 
         Args:
-            oracle_address: Oracle address
-            price_history: Historical prices
+            oracle_str: Oracle address as a string
+            series: Price history with its derived series
+                (at least _MIN_HISTORY_LONG_TAIL prices)
 
         Returns:
             List of detected long-tail poisoning threats
@@ -250,49 +419,44 @@ class TimeWeightedOracleScanner:
         threats: List[OracleThreat] = []
 
         try:
-            if len(price_history) < 100:
-                return threats
-
             # Analyze long-term trends
             # Check if price has been gradually moving in one direction
             # over extended period (e.g., 7200 seconds = 2 hours)
 
             # Calculate trend
-            start_price = price_history[0]
-            end_price = price_history[-1]
-            total_change = abs(end_price - start_price) / start_price
+            start_price = series.prices[0]
+            total_change = abs(series.prices[-1] - start_price) / start_price
 
             # If significant change over long period with small per-block changes
-            if total_change > 0.10:  # 10% total change
-                avg_block_change = total_change / len(price_history)
-                if avg_block_change < 0.001:  # Small per-block changes
-                    threat = OracleThreat(
-                        threat_type="long_tail_poisoning",
-                        severity="high",
-                        description=f"Detected long-tail poisoning: {total_change*100:.2f}% change over {len(price_history)} blocks",
-                        oracle_address=str(oracle_address),
-                        manipulation_duration=len(price_history),
-                        price_skew_percentage=total_change * 100,
-                        confidence=0.8,
-                    )
-                    threats.append(threat)
-                    logger.warning(
-                        f"Long-tail poisoning detected: {total_change*100:.2f}% over {len(price_history)} blocks"
-                    )
+            if total_change > 0.10 and total_change / len(series.prices) < 0.001:
+                threat = OracleThreat(
+                    threat_type="long_tail_poisoning",
+                    severity="high",
+                    description=f"Detected long-tail poisoning: {total_change*100:.2f}% change over {len(series.prices)} blocks",
+                    oracle_address=oracle_str,
+                    manipulation_duration=len(series.prices),
+                    price_skew_percentage=total_change * 100,
+                    confidence=0.8,
+                )
+                threats.append(threat)
+                logger.warning(
+                    f"Long-tail poisoning detected: {total_change*100:.2f}% over {len(series.prices)} blocks"
+                )
 
         except Exception as e:
             logger.exception(f"Error detecting long-tail poisoning: {e}")
 
         return threats
 
-    async def _detect_twap_manipulation(
-        self, oracle_address: Pubkey, price_history: List[float]
+    def _detect_twap_manipulation(
+        self, oracle_str: str, series: _PriceSeries
     ) -> List[OracleThreat]:
         """Detect TWAP (Time-Weighted Average Price) manipulation.
 
         Args:
-            oracle_address: Oracle address
-            price_history: Historical prices
+            oracle_str: Oracle address as a string
+            series: Price history with its derived series
+                (at least _MIN_HISTORY_TWAP prices)
 
         Returns:
             List of detected TWAP manipulation threats
@@ -300,24 +464,15 @@ class TimeWeightedOracleScanner:
         threats: List[OracleThreat] = []
 
         try:
-            if len(price_history) < 20:
-                return threats
-
-            # Calculate TWAP
-            twap = sum(price_history) / len(price_history)
-
-            # Check if recent prices are consistently skewed
-            recent_prices = price_history[-10:]
-            recent_avg = sum(recent_prices) / len(recent_prices)
-
-            deviation = abs(recent_avg - twap) / twap
+            # Check if recent prices are consistently skewed from TWAP
+            deviation = _twap_kernel(series)
 
             if deviation > 0.05:  # 5% deviation from TWAP
                 threat = OracleThreat(
                     threat_type="twap_manipulation",
                     severity="high",
                     description=f"Detected TWAP manipulation: {deviation*100:.2f}% deviation",
-                    oracle_address=str(oracle_address),
+                    oracle_address=oracle_str,
                     price_skew_percentage=deviation * 100,
                     confidence=0.75,
                 )
@@ -332,28 +487,8 @@ class TimeWeightedOracleScanner:
         """Get a summary of all detected threats.
 
         Returns:
-            Summary dictionary with threat counts and details
+            Summary dictionary with threat counts and details. The
+            "threats" is a read-only view whose entries are shared between calls.
         """
-        critical = [t for t in self.detected_threats if t.severity == "critical"]
-        high = [t for t in self.detected_threats if t.severity == "high"]
-        medium = [t for t in self.detected_threats if t.severity == "medium"]
-        low = [t for t in self.detected_threats if t.severity == "low"]
-
-        return {
-            "total_threats": len(self.detected_threats),
-            "critical": len(critical),
-            "high": len(high),
-            "medium": len(medium),
-            "low": len(low),
-            "threats": [
-                {
-                    "type": t.threat_type,
-                    "severity": t.severity,
-                    "description": t.description,
-                    "confidence": t.confidence,
-                    "price_skew": t.price_skew_percentage,
-                }
-                for t in self.detected_threats
-            ],
-        }
+        return self._summary.summarize(self.detected_threats)
 
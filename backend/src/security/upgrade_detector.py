@@ -11,12 +11,13 @@ from typing import Any, Dict, List, Optional
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
+from security.threat_summary import ThreatSummaryCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeThreat:
     """Represents a detected upgrade exploit threat."""
 
@@ -29,6 +30,17 @@ class UpgradeThreat:
     confidence: float = 0.0  # 0.0 to 1.0
 
 
+def _serialize_threat(t: UpgradeThreat) -> Dict[str, Any]:
+    """Convert a threat into its get_threat_summary entry."""
+    return {
+        "type": t.threat_type,
+        "severity": t.severity,
+        "description": t.description,
+        "confidence": t.confidence,
+        "estimated_bounty": t.estimated_bounty,
+    }
+
+
 class UpgradeExploitDetector:
     """
     Detects smart contract upgrade exploits including:
@@ -47,6 +59,7 @@ class UpgradeExploitDetector:
         """
         self.client = client
         self.detected_threats: List[UpgradeThreat] = []
+        self._summary = ThreatSummaryCache(_serialize_threat)
 
     async def scan_contract(
         self, contract_address: Pubkey
@@ -64,21 +77,21 @@ class UpgradeExploitDetector:
         threats: List[UpgradeThreat] = []
 
         # Check for proxy patterns
-        proxy_threats = await self._detect_proxy_vulnerabilities(contract_address)
+        proxy_threats = self._detect_proxy_vulnerabilities(contract_address)
         threats.extend(proxy_threats)
 
         # Check for storage collisions
-        storage_threats = await self._detect_storage_collisions(contract_address)
+        storage_threats = self._detect_storage_collisions(contract_address)
         threats.extend(storage_threats)
 
         # Check for delegatecall issues
-        delegatecall_threats = await self._detect_delegatecall_issues(
+        delegatecall_threats = self._detect_delegatecall_issues(
             contract_address
         )
         threats.extend(delegatecall_threats)
 
         # Check for upgrade path vulnerabilities
-        upgrade_path_threats = await self._detect_upgrade_path_vulnerabilities(
+        upgrade_path_threats = self._detect_upgrade_path_vulnerabilities(
             contract_address
         )
         threats.extend(upgrade_path_threats)
@@ -88,7 +101,7 @@ class UpgradeExploitDetector:
 
         return threats
 
-    async def _detect_proxy_vulnerabilities(
+    def _detect_proxy_vulnerabilities(
         self, contract_address: Pubkey
     ) -> List[UpgradeThreat]:
         """Detect transparent proxy vulnerabilities.
@@ -127,7 +140,7 @@ class UpgradeExploitDetector:
 
         return threats
 
-    async def _detect_storage_collisions(
+    def _detect_storage_collisions(
         self, contract_address: Pubkey
     ) -> List[UpgradeThreat]:
         """Detect storage layout collisions.
@@ -159,7 +172,7 @@ class UpgradeExploitDetector:
 
         return threats
 
-    async def _detect_delegatecall_issues(
+    def _detect_delegatecall_issues(
         self, contract_address: Pubkey
     ) -> List[UpgradeThreat]:
         """Detect delegatecall context issues.
@@ -192,7 +205,7 @@ class UpgradeExploitDetector:
 
         return threats
 
-    async def _detect_upgrade_path_vulnerabilities(
+    def _detect_upgrade_path_vulnerabilities(
         self, contract_address: Pubkey
     ) -> List[UpgradeThreat]:
         """Detect upgrade path vulnerabilities.
@@ -229,28 +242,8 @@ class UpgradeExploitDetector:
         """Get a summary of all detected threats.
 
         Returns:
-            Summary dictionary with threat counts and details
+            Summary dictionary with threat counts and details. The
+            "threats" is a read-only view whose entries are shared between calls.
         """
-        critical = [t for t in self.detected_threats if t.severity == "critical"]
-        high = [t for t in self.detected_threats if t.severity == "high"]
-        medium = [t for t in self.detected_threats if t.severity == "medium"]
-        low = [t for t in self.detected_threats if t.severity == "low"]
-
-        return {
-            "total_threats": len(self.detected_threats),
-            "critical": len(critical),
-            "high": len(high),
-            "medium": len(medium),
-            "low": len(low),
-            "threats": [
-                {
-                    "type": t.threat_type,
-                    "severity": t.severity,
-                    "description": t.description,
-                    "confidence": t.confidence,
-                    "estimated_bounty": t.estimated_bounty,
-                }
-                for t in self.detected_threats
-            ],
-        }
+        return self._summary.summarize(self.detected_threats)
 
@@ -2,11 +2,15 @@
 Trading strategy modules.
 """
 
-try:
-    from strategies.combinator import StrategyCombinator
+__all__ = ["StrategyCombinator"]
 
-    __all__ = ["StrategyCombinator"]
-except ImportError:
-    # Allow partial imports during development
-    __all__ = []
 
+def __getattr__(name: str):
+    # Lazy-load the combinator (PEP 562) so `import strategies` stays cheap and
+    # genuine import errors surface where the combinator is actually used.
+    if name == "StrategyCombinator":
+        from strategies.combinator import StrategyCombinator
+
+        globals()[name] = StrategyCombinator
+        return StrategyCombinator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
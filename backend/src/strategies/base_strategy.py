@@ -5,8 +5,10 @@ Defines the abstract base class that all trading strategies must implement.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Optional, List, Sequence, Tuple
 from enum import Enum
 import time
 import logging
@@ -14,8 +16,78 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class StrategyType(Enum):
-    """Available strategy types"""
+# Exit reason codes returned by _check_exit and BaseStrategy.check_exit_code
+EXIT_NONE = 0
+EXIT_TAKE_PROFIT = 1
+EXIT_STOP_LOSS = 2
+EXIT_MAX_HOLD_TIME = 3
+
+# Shared read-only default for StrategySignal.metadata; replaced on first write.
+# Strategies may pass their own MappingProxyType constants the same way.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Reason templates indexed by exit code; formatted only when a position exits
+_EXIT_REASONS = (
+    "",
+    "Take-profit reached ({:.2%})",
+    "Stop-loss triggered ({:.2%})",
+    "Max hold time reached ({:.0f}s)",
+)
+
+
+def _check_exit(
+    entry_price: float,
+    entry_time: float,
+    current_price: float,
+    current_time: float,
+    take_profit: float,
+    stop_loss: float,
+    max_hold_time: float,
+) -> Tuple[int, float]:
+    """Scalar exit check on plain floats.
+
+    Returns:
+        Tuple of (exit code, value for the reason: P&L fraction or hold seconds)
+    """
+    pnl_percent = (current_price - entry_price) / entry_price
+    if pnl_percent >= take_profit:
+        return EXIT_TAKE_PROFIT, pnl_percent
+    if pnl_percent <= stop_loss:
+        return EXIT_STOP_LOSS, pnl_percent
+
+    hold_time = current_time - entry_time
+    if hold_time >= max_hold_time:
+        return EXIT_MAX_HOLD_TIME, hold_time
+    return EXIT_NONE, pnl_percent
+
+
+def format_exit_reason(code: int, value: float) -> str:
+    """Human-readable reason for an EXIT_* code returned by check_exit_code"""
+    return _EXIT_REASONS[code].format(value)
+
+
+def _position_size(
+    available_capital: float,
+    security_score: float,
+    capital_allocation: float,
+    max_position_size: float,
+) -> float:
+    """Allocated capital capped at max size, scaled down below a score of 70.
+
+    Positions under the 0.1 SOL minimum come back as 0.0.
+    """
+    position_size = min(available_capital * capital_allocation, max_position_size) * min(
+        1.0, security_score / 70.0
+    )
+    return round(position_size, 4) if position_size >= 0.1 else 0.0
+
+
+class StrategyType(str, Enum):
+    """Available strategy types
+
+    Members are str instances: they hash and compare like their value, so
+    they work as dict keys next to plain strings and format as the value.
+    """
     SNIPE = "snipe"
     VOLUME_BOOST = "volume_boost"
     MOMENTUM = "momentum"
@@ -24,8 +96,28 @@ class StrategyType(Enum):
     MARKET_MAKING = "market_making"
     SOCIAL_SIGNALS = "social_signals"
 
+    __str__ = str.__str__
 
-@dataclass
+
+class MarketSnapshot(NamedTuple):
+    """Typed per-token market fields shared by every strategy on a tick"""
+    token_address: str = ""
+    price: float = 0.0
+    liquidity_sol: float = 0.0
+    volume_1h: float = 0.0
+    volume_24h: float = 0.0
+    market_cap_usd: float = 0.0
+    holder_count: int = 0
+    age_seconds: int = 0
+    security_score: int = 50
+    slippage: float = 0.1
+    creator: str = ""
+    liquidity_locked: bool = False
+    has_mint_authority: bool = False
+    has_freeze_authority: bool = False
+
+
+@dataclass(slots=True)
 class StrategySignal:
     """Signal emitted by a strategy"""
     strategy_name: str
@@ -33,23 +125,95 @@ class StrategySignal:
     confidence: float  # 0.0 to 1.0
     position_size: float  # SOL amount
     reason: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # mappingproxy is unhashable, so dataclass needs it behind a factory
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA)
     timestamp: float = field(default_factory=time.time)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        metadata = self.metadata
         return {
             "strategy_name": self.strategy_name,
             "action": self.action,
             "confidence": self.confidence,
             "position_size": self.position_size,
             "reason": self.reason,
-            "metadata": self.metadata,
+            "metadata": metadata if type(metadata) is dict else dict(metadata),
             "timestamp": self.timestamp,
         }
 
+    def set_metadata(self, key: str, value: Any):
+        """Set a metadata entry, copying shared read-only metadata on first write"""
+        if type(self.metadata) is not dict:
+            self.metadata = dict(self.metadata)
+        self.metadata[key] = value
+
+    def reset(
+        self,
+        strategy_name: str,
+        action: str,
+        confidence: float,
+        position_size: float,
+        reason: str,
+        metadata: Optional[Mapping[str, Any]] = None,
+        timestamp: Optional[float] = None,
+    ) -> "StrategySignal":
+        """Rebind every field in place (used by SignalPool)"""
+        self.strategy_name = strategy_name
+        self.action = action
+        self.confidence = confidence
+        self.position_size = position_size
+        self.reason = reason
+        self.metadata = _EMPTY_METADATA if metadata is None else metadata
+        self.timestamp = time.time() if timestamp is None else timestamp
+        return self
+
+
+class SignalPool:
+    """
+    Bounded free list of StrategySignal instances.
+
+    acquire() takes the same arguments as StrategySignal and reuses a released
+    instance when one is available. A released signal is rebound by the next
+    acquire(), so only the final consumer of a signal may release it, and it
+    must not keep the reference (copy via to_dict() if needed).
+    """
+
+    def __init__(self, size: int = 64):
+        self._free: deque = deque(maxlen=size)
+
+    def acquire(
+        self,
+        strategy_name: str,
+        action: str,
+        confidence: float,
+        position_size: float,
+        reason: str,
+        metadata: Optional[Mapping[str, Any]] = None,
+        timestamp: Optional[float] = None,
+    ) -> StrategySignal:
+        """Get a signal with the given fields, recycled if possible"""
+        if self._free:
+            return self._free.pop().reset(
+                strategy_name, action, confidence, position_size, reason,
+                metadata, timestamp,
+            )
+        return StrategySignal(
+            strategy_name, action, confidence, position_size, reason,
+            _EMPTY_METADATA if metadata is None else metadata,
+            time.time() if timestamp is None else timestamp,
+        )
+
+    def release(self, signal: StrategySignal):
+        """Return a signal to the pool once it has been fully consumed"""
+        self._free.append(signal)
+
 
-@dataclass
+# Shared by all strategies; the combinator releases signals after acting on them
+signal_pool = SignalPool()
+
+
+@dataclass(slots=True)
 class StrategyConfig:
     """Base configuration for all strategies"""
     enabled: bool = True
@@ -73,7 +237,7 @@ class StrategyConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyPerformance:
     """Track strategy performance metrics"""
     trades_count: int = 0
@@ -105,15 +269,18 @@ class StrategyPerformance:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        # Derived metrics inline: one trades_count check instead of three calls
+        trades_count = self.trades_count
+        total_pnl = self.total_pnl
         return {
-            "trades_count": self.trades_count,
+            "trades_count": trades_count,
             "wins": self.wins,
             "losses": self.losses,
-            "win_rate": self.get_win_rate(),
-            "total_pnl": self.total_pnl,
+            "win_rate": self.wins / trades_count if trades_count else 0.0,
+            "total_pnl": total_pnl,
             "total_fees": self.total_fees,
-            "net_pnl": self.get_net_pnl(),
-            "avg_pnl": self.get_avg_pnl(),
+            "net_pnl": total_pnl - self.total_fees,
+            "avg_pnl": total_pnl / trades_count if trades_count else 0.0,
             "best_trade": self.best_trade,
             "worst_trade": self.worst_trade,
             "total_volume": self.total_volume,
@@ -123,11 +290,23 @@ class StrategyPerformance:
 
 
 class BaseStrategy(ABC):
-    """Abstract base class for all trading strategies"""
+    """
+    Abstract base class for all trading strategies
+
+    The base attributes live in __slots__. Subclasses that declare no
+    __slots__ of their own get a __dict__ back for their extra state.
+    """
+
+    __slots__ = (
+        "config", "strategy_type", "strategy_value", "name", "enabled", "performance",
+        "_cache",
+    )
 
     def __init__(self, config: StrategyConfig, strategy_type: StrategyType):
         self.config = config
         self.strategy_type = strategy_type
+        # Plain str of strategy_type.value, read per signal without the Enum property
+        self.strategy_value: str = strategy_type.value
         self.name = self.__class__.__name__
         self.enabled = config.enabled
         self.performance = StrategyPerformance()
@@ -135,7 +314,9 @@ class BaseStrategy(ABC):
         # Cache for strategy-specific data
         self._cache: Dict[str, Any] = {}
 
-        logger.info(f"Initialized {self.name} (type={strategy_type.value}, enabled={self.enabled})")
+        logger.info(
+            "Initialized %s (type=%s, enabled=%s)", self.name, self.strategy_value, self.enabled
+        )
 
     @abstractmethod
     async def analyze(self, market_data: Dict[str, Any]) -> StrategySignal:
@@ -210,23 +391,34 @@ class BaseStrategy(ABC):
         Returns:
             Position size in SOL
         """
-        # Base calculation: allocated capital
-        allocated = available_capital * self.config.capital_allocation
-
-        # Apply max position size limit
-        position_size = min(allocated, self.config.max_position_size)
+        return _position_size(
+            available_capital,
+            market_data.get("security_score", 50),
+            self.config.capital_allocation,
+            self.config.max_position_size,
+        )
 
-        # Adjust based on security score (lower security = smaller position)
-        security_score = market_data.get("security_score", 50)
-        if security_score < 70:
-            security_multiplier = security_score / 70.0
-            position_size *= security_multiplier
+    def calculate_position_sizes(
+        self,
+        available_capitals: Sequence[float],
+        security_scores: Sequence[float],
+    ) -> List[float]:
+        """
+        Batch form of calculate_position_size for many candidate tokens
 
-        # Ensure minimum viable position (0.1 SOL minimum)
-        if position_size < 0.1:
-            return 0.0
+        Args:
+            available_capitals: Available capital in SOL, one per token
+            security_scores: Security score, one per token
 
-        return round(position_size, 4)
+        Returns:
+            Position sizes in SOL, in input order
+        """
+        capital_allocation = self.config.capital_allocation
+        max_position_size = self.config.max_position_size
+        return [
+            _position_size(capital, score, capital_allocation, max_position_size)
+            for capital, score in zip(available_capitals, security_scores)
+        ]
 
     async def on_trade_enter(
         self,
@@ -247,8 +439,8 @@ class BaseStrategy(ABC):
         self.performance.total_volume += amount
         self.performance.total_fees += fees
         logger.info(
-            f"{self.name} entered trade: {token_address} at {entry_price} "
-            f"with {amount} SOL (fees: {fees})"
+            "%s entered trade: %s at %s with %s SOL (fees: %s)",
+            self.name, token_address, entry_price, amount, fees,
         )
 
     async def on_trade_exit(
@@ -258,7 +450,8 @@ class BaseStrategy(ABC):
         exit_price: float,
         amount: float,
         hold_time: float,
-        fees: float = 0.0
+        fees: float = 0.0,
+        now: Optional[float] = None
     ):
         """
         Called when strategy exits a trade
@@ -270,6 +463,7 @@ class BaseStrategy(ABC):
             amount: Position size in SOL
             hold_time: Hold time in seconds
             fees: Transaction fees
+            now: Tick timestamp, if the caller already has one
         """
         # Calculate P&L
         pnl_percent = (exit_price - entry_price) / entry_price
@@ -280,7 +474,7 @@ class BaseStrategy(ABC):
         self.performance.trades_count += 1
         self.performance.total_pnl += pnl_sol
         self.performance.total_fees += fees
-        self.performance.last_trade_time = time.time()
+        self.performance.last_trade_time = time.time() if now is None else now
 
         if was_win:
             self.performance.wins += 1
@@ -293,18 +487,14 @@ class BaseStrategy(ABC):
         if pnl_sol < self.performance.worst_trade:
             self.performance.worst_trade = pnl_sol
 
-        # Update average hold time
-        if self.performance.trades_count == 1:
-            self.performance.avg_hold_time = hold_time
-        else:
-            # Weighted average
-            total_time = self.performance.avg_hold_time * (self.performance.trades_count - 1)
-            self.performance.avg_hold_time = (total_time + hold_time) / self.performance.trades_count
+        # Update average hold time (incremental mean; first trade yields hold_time)
+        self.performance.avg_hold_time += (
+            (hold_time - self.performance.avg_hold_time) / self.performance.trades_count
+        )
 
         logger.info(
-            f"{self.name} exited trade: {token_address} "
-            f"P&L: {pnl_sol:.4f} SOL ({pnl_percent:.2%}) "
-            f"Hold: {hold_time:.0f}s (fees: {fees})"
+            "%s exited trade: %s P&L: %.4f SOL (%.2f%%) Hold: %.0fs (fees: %s)",
+            self.name, token_address, pnl_sol, pnl_percent * 100, hold_time, fees,
         )
 
     def check_exit_conditions(
@@ -324,36 +514,53 @@ class BaseStrategy(ABC):
         Returns:
             Tuple of (should_exit, reason)
         """
-        entry_price = position.get("entry_price")
-        entry_time = position.get("entry_time")
-
-        if not entry_price or not entry_time:
+        code, value = self.check_exit_code(position, current_price, current_time)
+        if code == EXIT_NONE:
             return False, ""
 
-        # Calculate P&L percentage
-        pnl_percent = (current_price - entry_price) / entry_price
+        return True, format_exit_reason(code, value)
 
-        # Check take-profit
-        if pnl_percent >= self.config.take_profit:
-            return True, f"Take-profit reached ({pnl_percent:.2%})"
+    def check_exit_code(
+        self,
+        position: Dict[str, Any],
+        current_price: float,
+        current_time: float
+    ) -> Tuple[int, float]:
+        """
+        Like check_exit_conditions, but without building the reason string
 
-        # Check stop-loss
-        if pnl_percent <= self.config.stop_loss:
-            return True, f"Stop-loss triggered ({pnl_percent:.2%})"
+        Args:
+            position: Position data
+            current_price: Current token price
+            current_time: Current timestamp
 
-        # Check max hold time
-        hold_time = current_time - entry_time
-        if hold_time >= self.config.max_hold_time:
-            return True, f"Max hold time reached ({hold_time:.0f}s)"
+        Returns:
+            Tuple of (EXIT_* code, value for format_exit_reason)
+        """
+        entry_price = position.get("entry_price")
+        entry_time = position.get("entry_time")
 
-        return False, ""
+        if not entry_price or not entry_time:
+            return EXIT_NONE, 0.0
+
+        # Take-profit, then stop-loss, then max hold time
+        config = self.config
+        return _check_exit(
+            entry_price,
+            entry_time,
+            current_price,
+            current_time,
+            config.take_profit,
+            config.stop_loss,
+            config.max_hold_time,
+        )
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get comprehensive performance statistics"""
         stats = self.performance.to_dict()
         stats.update({
             "name": self.name,
-            "type": self.strategy_type.value,
+            "type": self.strategy_value,
             "enabled": self.enabled,
             "config": self.config.to_dict(),
         })
@@ -362,16 +569,16 @@ class BaseStrategy(ABC):
     def reset_performance(self):
         """Reset performance metrics (useful for testing)"""
         self.performance = StrategyPerformance()
-        logger.info(f"{self.name} performance metrics reset")
+        logger.info("%s performance metrics reset", self.name)
 
     def enable(self):
         """Enable the strategy"""
         self.enabled = True
         self.config.enabled = True
-        logger.info(f"{self.name} enabled")
+        logger.info("%s enabled", self.name)
 
     def disable(self):
         """Disable the strategy"""
         self.enabled = False
         self.config.enabled = False
-        logger.info(f"{self.name} disabled")
+        logger.info("%s disabled", self.name)
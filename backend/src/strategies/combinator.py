@@ -9,13 +9,15 @@ Supports:
 """
 
 import asyncio
-from dataclasses import dataclass
+import logging
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import time
 
 # Import new strategy implementations
-from .base_strategy import BaseStrategy, StrategyType
+from .base_strategy import BaseStrategy, MarketSnapshot, StrategyType, signal_pool
 from .snipe_strategy import SnipeStrategy, SnipeConfig
 from .momentum_strategy import MomentumStrategy, MomentumConfig
 from .reversal_strategy import ReversalStrategy, ReversalConfig
@@ -30,8 +32,46 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# Per-strategy performance metrics, stored column-wise (one array per metric)
+_PERF_COLUMNS = ("total_trades", "successful_trades", "total_profit", "total_volume")
+_TOTAL_TRADES, _SUCCESSFUL_TRADES, _TOTAL_PROFIT, _TOTAL_VOLUME = range(4)
+
+
+# Strategy-specific market_data inputs, keyed by strategy type
+_STRATEGY_INPUTS: Dict[StrategyType, Dict[str, Any]] = {
+    # Whale trade would come from whale tracker
+    StrategyType.WHALE_COPY: {"whale_trade": None},  # Placeholder
+    # Social signals would come from social scanner
+    StrategyType.SOCIAL_SIGNALS: {"social_signals": None},  # Placeholder
+}
+
+
+def _market_snapshot(token_info: TokenInfo, now: float) -> MarketSnapshot:
+    """Read the strategy-relevant fields of a token once per tick."""
+    # TokenInfo declares liquidity/volume_24h/creation_timestamp with a None
+    # default ("not yet observed"), so a getattr default alone would let None
+    # through
+    volume_24h = getattr(token_info, 'volume_24h', None) or 0.0
+    return MarketSnapshot(
+        token_address=str(token_info.mint),
+        price=getattr(token_info, 'price', 0.0),
+        liquidity_sol=getattr(token_info, 'liquidity', None) or 0.0,
+        volume_1h=volume_24h,  # Use 24h as proxy
+        volume_24h=volume_24h,
+        market_cap_usd=getattr(token_info, 'market_cap', 0.0),
+        holder_count=getattr(token_info, 'holder_count', 0),
+        age_seconds=int(now - (getattr(token_info, 'creation_timestamp', None) or now)),
+        security_score=getattr(token_info, 'security_score', 50),
+        # Additional fields that might be present
+        slippage=getattr(token_info, 'slippage', 0.1),
+        creator=getattr(token_info, 'creator', ""),
+        liquidity_locked=getattr(token_info, 'liquidity_locked', False),
+        has_mint_authority=getattr(token_info, 'has_mint_authority', False),
+        has_freeze_authority=getattr(token_info, 'has_freeze_authority', False),
+    )
+
+
+@dataclass(slots=True)
 class StrategyConfig:
     """Configuration for a trading strategy."""
 
@@ -40,10 +80,10 @@ class StrategyConfig:
     capital_allocation: float = 0.0  # 0.0 to 1.0 (percentage of total capital)
     min_confidence: float = 0.5  # Minimum confidence to execute
     max_position_size: float = 1.0  # Maximum position size in SOL
-    parameters: Dict[str, Any] = None
+    parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CombinedStrategyResult:
     """Result of executing a combined strategy."""
 
@@ -78,7 +118,15 @@ class StrategyCombinator:
         """
         self.strategies = strategies
         self.total_capital = total_capital
-        self.performance_tracking: Dict[str, Dict[str, Any]] = {}
+
+        # Performance tracking: strategy key -> row, plus one column per metric.
+        # Rows for the configured strategies are allocated up front.
+        self._perf_index: Dict[str, int] = {}
+        for s in strategies:
+            self._perf_index.setdefault(s.strategy_type.value, len(self._perf_index))
+        self._perf_columns = tuple(
+            array("d", bytes(8 * len(self._perf_index))) for _ in _PERF_COLUMNS
+        )
 
         # Initialize strategy instances
         self.strategy_instances: Dict[StrategyType, BaseStrategy] = {}
@@ -88,14 +136,78 @@ class StrategyCombinator:
         total_allocation = sum(s.capital_allocation for s in strategies if s.enabled)
         if total_allocation > 1.0:
             logger.warning(
-                f"Total capital allocation exceeds 100%: {total_allocation*100:.1f}%"
+                "Total capital allocation exceeds 100%%: %.1f%%", total_allocation * 100
             )
 
         logger.info(
-            f"Initialized Strategy Combinator with {len(strategies)} strategies, "
-            f"{total_capital} SOL capital"
+            "Initialized Strategy Combinator with %d strategies, %s SOL capital",
+            len(strategies), total_capital,
+        )
+
+        # Enabled strategies with their capital and instance, resolved once per
+        # config change so execution needs no per-token lookups
+        self._active: Tuple[Tuple[StrategyConfig, float, str, BaseStrategy], ...] = ()
+        self._recompute_active()
+
+    def _recompute_active(self) -> None:
+        """Rebuild the (config, capital, key, instance) tuple iterated on every token.
+
+        Configured strategies without an initialized instance are left out, so
+        no coroutine is scheduled for them.
+        """
+        instances = self.strategy_instances
+        self._active = tuple(
+            (s, capital, s.strategy_type.value, strategy)
+            for s in self.strategies
+            if s.enabled
+            and (capital := self.total_capital * s.capital_allocation) > 0
+            and (strategy := instances.get(s.strategy_type)) is not None
         )
 
+    def _find_config(self, strategy_type: StrategyType) -> StrategyConfig:
+        """Return the configuration for a strategy type (KeyError if absent)."""
+        for strategy_config in self.strategies:
+            if strategy_config.strategy_type == strategy_type:
+                return strategy_config
+        raise KeyError(f"Strategy {strategy_type.value} is not configured")
+
+    def enable_strategy(self, strategy_type: StrategyType) -> None:
+        """Enable a configured strategy.
+
+        Args:
+            strategy_type: Strategy to enable
+        """
+        self._find_config(strategy_type).enabled = True
+        self._recompute_active()
+
+    def disable_strategy(self, strategy_type: StrategyType) -> None:
+        """Disable a configured strategy.
+
+        Args:
+            strategy_type: Strategy to disable
+        """
+        self._find_config(strategy_type).enabled = False
+        self._recompute_active()
+
+    def set_allocation(self, strategy_type: StrategyType, capital_allocation: float) -> None:
+        """Change a strategy's capital allocation.
+
+        Args:
+            strategy_type: Strategy to update
+            capital_allocation: New allocation (0.0 to 1.0)
+        """
+        self._find_config(strategy_type).capital_allocation = capital_allocation
+        self._recompute_active()
+
+    def set_total_capital(self, total_capital: float) -> None:
+        """Change the total capital shared by all strategies.
+
+        Args:
+            total_capital: Total capital available for trading
+        """
+        self.total_capital = total_capital
+        self._recompute_active()
+
     def _initialize_strategies(self):
         """Initialize all strategy instances"""
         # Initialize Snipe Strategy
@@ -162,55 +274,71 @@ class StrategyCombinator:
         )
         self.strategy_instances[StrategyType.MARKET_MAKING] = MarketMakingStrategy(market_making_config)
 
-        logger.info(f"Initialized {len(self.strategy_instances)} strategy instances")
+        logger.info("Initialized %d strategy instances", len(self.strategy_instances))
 
     async def execute_combined_strategy(
-        self, token_info: TokenInfo
+        self, token_info: TokenInfo, now: Optional[float] = None
     ) -> CombinedStrategyResult:
         """Execute a combined strategy for a token.
 
         Args:
             token_info: Token information
+            now: Tick timestamp for the token snapshot (defaults to time.time())
 
         Returns:
             Combined strategy execution result
         """
-        logger.info(f"Executing combined strategy for {token_info.symbol}...")
+        logger.info("Executing combined strategy for %s...", token_info.symbol)
+
+        if now is None:
+            now = time.time()
 
+        # Fresh per call: both lists are handed to the caller inside the
+        # CombinedStrategyResult, so they cannot come from a reusable buffer.
+        # The per-strategy results are already collected by one gather().
         executed_strategies: List[str] = []
         results: List[TradeResult] = []
         total_capital_used = 0.0
+        combined_profit = 0.0
 
         try:
-            # Execute each enabled strategy
-            for strategy_config in self.strategies:
-                if not strategy_config.enabled:
-                    continue
-
-                # Calculate capital allocation
-                capital_amount = self.total_capital * strategy_config.capital_allocation
+            # Token fields are read once into a market_data template that each
+            # strategy gets a shallow copy of
+            market_template = _market_snapshot(token_info, now)._asdict()
+
+            # Execute enabled strategies concurrently; one failure doesn't
+            # abort the rest
+            active = self._active
+            strategy_results = await asyncio.gather(
+                *(
+                    self._execute_strategy(
+                        strategy_config, strategy, market_template, capital_amount
+                    )
+                    for strategy_config, capital_amount, _, strategy in active
+                ),
+                return_exceptions=True,
+            )
 
-                if capital_amount <= 0:
+            for (strategy_config, capital_amount, strategy_key, _), strategy_result in zip(
+                active, strategy_results
+            ):
+                if isinstance(strategy_result, BaseException):
+                    logger.error(
+                        "Strategy %s failed: %s", strategy_key, strategy_result,
+                        exc_info=strategy_result,
+                    )
                     continue
 
-                # Execute strategy
-                strategy_result = await self._execute_strategy(
-                    strategy_config, token_info, capital_amount
-                )
-
                 if strategy_result:
-                    executed_strategies.append(strategy_config.strategy_type.value)
+                    executed_strategies.append(strategy_key)
                     results.append(strategy_result)
                     total_capital_used += capital_amount
+                    if strategy_result.success:
+                        combined_profit += strategy_result.price * strategy_result.amount
 
                     # Track performance
                     self._track_performance(strategy_config, strategy_result)
 
-            # Calculate combined profit
-            combined_profit = sum(
-                (r.price * r.amount) if r.success else 0.0 for r in results
-            )
-
             return CombinedStrategyResult(
                 success=len(results) > 0,
                 strategies_executed=executed_strategies,
@@ -220,7 +348,7 @@ class StrategyCombinator:
             )
 
         except Exception as e:
-            logger.exception(f"Error executing combined strategy: {e}")
+            logger.exception("Error executing combined strategy: %s", e)
             return CombinedStrategyResult(
                 success=False,
                 strategies_executed=executed_strategies,
@@ -230,91 +358,78 @@ class StrategyCombinator:
             )
 
     async def _execute_strategy(
-        self, strategy_config: StrategyConfig, token_info: TokenInfo, capital: float
+        self,
+        strategy_config: StrategyConfig,
+        strategy: BaseStrategy,
+        market_template: Dict[str, Any],
+        capital: float,
     ) -> Optional[TradeResult]:
         """Execute a single strategy.
 
         Args:
             strategy_config: Strategy configuration
-            token_info: Token information
+            strategy: Strategy instance
+            market_template: Token market_data shared by all strategies (not mutated)
             capital: Capital allocated to this strategy
 
         Returns:
             Trade result if executed, None otherwise
         """
-        try:
-            strategy_type = strategy_config.strategy_type
-            logger.debug(
-                f"Executing {strategy_type.value} strategy "
-                f"with {capital:.6f} SOL..."
-            )
+        # No blanket try/except: execute_combined_strategy gathers with
+        # return_exceptions=True and logs any failure with its traceback
+        strategy_type = strategy_config.strategy_type
+        logger.debug(
+            "Executing %s strategy with %.6f SOL...", strategy_type, capital
+        )
 
-            # Get strategy instance
-            strategy = self.strategy_instances.get(strategy_type)
-            if not strategy or not strategy.enabled:
-                logger.debug(f"Strategy {strategy_type.value} not available or disabled")
-                return None
+        # The instance can still be toggled directly via enable()/disable()
+        if not strategy.enabled:
+            logger.debug("Strategy %s disabled", strategy_type)
+            return None
 
-            # Prepare market data
-            market_data = {
-                "token_address": str(token_info.address),
-                "price": getattr(token_info, 'price', 0.0),
-                "liquidity_sol": getattr(token_info, 'liquidity', 0.0),
-                "volume_1h": getattr(token_info, 'volume_24h', 0.0),  # Use 24h as proxy
-                "volume_24h": getattr(token_info, 'volume_24h', 0.0),
-                "market_cap_usd": getattr(token_info, 'market_cap', 0.0),
-                "holder_count": getattr(token_info, 'holder_count', 0),
-                "age_seconds": int(time.time() - getattr(token_info, 'created_at', time.time())),
-                "security_score": getattr(token_info, 'security_score', 50),
-                "available_capital": capital,
-                "current_positions": [],  # Would come from position manager
-                # Additional fields that might be present
-                "slippage": getattr(token_info, 'slippage', 0.1),
-                "creator": getattr(token_info, 'creator', ""),
-                "liquidity_locked": getattr(token_info, 'liquidity_locked', False),
-                "has_mint_authority": getattr(token_info, 'has_mint_authority', False),
-                "has_freeze_authority": getattr(token_info, 'has_freeze_authority', False),
-            }
+        # Prepare market data
+        market_data = market_template.copy()
+        market_data["available_capital"] = capital
+        market_data["current_positions"] = []  # Would come from position manager
 
-            # Add strategy-specific data
-            if strategy_type == StrategyType.WHALE_COPY:
-                # Whale trade would come from whale tracker
-                market_data["whale_trade"] = None  # Placeholder
-            elif strategy_type == StrategyType.SOCIAL_SIGNALS:
-                # Social signals would come from social scanner
-                market_data["social_signals"] = None  # Placeholder
+        # Add strategy-specific data
+        extra_inputs = _STRATEGY_INPUTS.get(strategy_type)
+        if extra_inputs:
+            market_data.update(extra_inputs)
 
-            # Analyze with strategy
-            signal = await strategy.analyze(market_data)
+        # Analyze with strategy
+        signal = await strategy.analyze(market_data)
 
+        try:
             # Check if strategy wants to act
             if signal.action == "buy" and signal.confidence >= strategy_config.min_confidence:
                 logger.info(
-                    f"{strategy_type.value} strategy signaling BUY: "
-                    f"confidence={signal.confidence:.0%}, "
-                    f"size={signal.position_size:.4f} SOL"
+                    "%s strategy signaling BUY: confidence=%.0f%%, size=%.4f SOL",
+                    strategy_type, signal.confidence * 100, signal.position_size,
                 )
 
                 # Create trade result (in production, would actually execute trade)
                 trade_result = TradeResult(
                     success=True,
                     amount=signal.position_size,
-                    price=market_data.get("price", 0.0),
-                    timestamp=time.time(),
+                    price=market_template["price"],
                 )
 
                 return trade_result
 
             else:
-                logger.debug(
-                    f"{strategy_type.value} strategy decision: {signal.action} "
-                    f"(confidence={signal.confidence:.0%}, reason={signal.reason})"
-                )
+                # Most signals end here; skip building the arguments when
+                # debug logging is off
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "%s strategy decision: %s (confidence=%.0f%%, reason=%s)",
+                        strategy_type, signal.action, signal.confidence * 100,
+                        signal.reason,
+                    )
                 return None
-
-        except Exception as e:
-            logger.exception(f"Error executing strategy {strategy_config.strategy_type.value}: {e}")
-            return None
+        finally:
+            # Every field has been read; hand the signal back to the pool
+            signal_pool.release(signal)
 
     def _track_performance(
         self, strategy_config: StrategyConfig, result: TradeResult
@@ -325,24 +440,40 @@ class StrategyCombinator:
             strategy_config: Strategy configuration
             result: Trade result
         """
-        strategy_key = strategy_config.strategy_type.value
-
-        if strategy_key not in self.performance_tracking:
-            self.performance_tracking[strategy_key] = {
-                "total_trades": 0,
-                "successful_trades": 0,
-                "total_profit": 0.0,
-                "total_volume": 0.0,
-            }
+        strategy_type = strategy_config.strategy_type
+        columns = self._perf_columns
 
-        stats = self.performance_tracking[strategy_key]
-        stats["total_trades"] += 1
+        # StrategyType hashes like its value, so it looks up the str keys directly
+        row = self._perf_index.get(strategy_type)
+        if row is None:
+            # Strategy added after construction
+            row = self._perf_index[strategy_type.value] = len(columns[_TOTAL_TRADES])
+            for column in columns:
+                column.append(0.0)
+
+        columns[_TOTAL_TRADES][row] += 1
 
         if result.success:
-            stats["successful_trades"] += 1
-            profit = result.price * result.amount if result.price and result.amount else 0.0
-            stats["total_profit"] += profit
-            stats["total_volume"] += result.amount if result.amount else 0.0
+            columns[_SUCCESSFUL_TRADES][row] += 1
+            # TradeResult leaves price/amount as None when unknown; count those as 0
+            amount = result.amount or 0.0
+            columns[_TOTAL_PROFIT][row] += (result.price or 0.0) * amount
+            columns[_TOTAL_VOLUME][row] += amount
+
+    @property
+    def performance_tracking(self) -> Dict[str, Dict[str, Any]]:
+        """Per-strategy performance stats, built on demand from the metric columns."""
+        columns = self._perf_columns
+        return {
+            strategy_key: {
+                "total_trades": int(columns[_TOTAL_TRADES][row]),
+                "successful_trades": int(columns[_SUCCESSFUL_TRADES][row]),
+                "total_profit": columns[_TOTAL_PROFIT][row],
+                "total_volume": columns[_TOTAL_VOLUME][row],
+            }
+            for strategy_key, row in self._perf_index.items()
+            if columns[_TOTAL_TRADES][row]
+        }
 
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance summary for all strategies.
@@ -350,15 +481,11 @@ class StrategyCombinator:
         Returns:
             Performance summary dictionary
         """
-        total_trades = sum(
-            stats["total_trades"] for stats in self.performance_tracking.values()
-        )
-        total_successful = sum(
-            stats["successful_trades"] for stats in self.performance_tracking.values()
-        )
-        total_profit = sum(
-            stats["total_profit"] for stats in self.performance_tracking.values()
-        )
+        # Column sums run over contiguous doubles, no per-strategy dict walks
+        columns = self._perf_columns
+        total_trades = int(sum(columns[_TOTAL_TRADES]))
+        total_successful = int(sum(columns[_SUCCESSFUL_TRADES]))
+        total_profit = sum(columns[_TOTAL_PROFIT])
 
         success_rate = (
             total_successful / max(total_trades, 1) if total_trades > 0 else 0.0
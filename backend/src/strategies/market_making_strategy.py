@@ -6,18 +6,22 @@ Profits from bid-ask spread while maintaining balanced inventory.
 """
 
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 
 from strategies.base_strategy import (
     BaseStrategy,
     StrategyType,
     StrategySignal,
     StrategyConfig,
+    signal_pool,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketMakingConfig(StrategyConfig):
     """Configuration for Market Making Strategy."""
 
@@ -46,6 +50,8 @@ class MarketMakingConfig(StrategyConfig):
     max_position_size_sol: float = 5.0  # Maximum total position
     stop_loss_percentage: float = 0.15  # 15% stop loss
     volatility_threshold: float = 0.30  # Pause if volatility >30%
+    price_window: int = 120  # Prices kept per token when no price_history is supplied
+    max_tracked_tokens: int = 1000  # Tokens with volatility state / price windows (LRU)
 
     # Timing
     rebalance_interval: int = 300  # Rebalance every 5 minutes
@@ -58,6 +64,117 @@ class MarketMakingConfig(StrategyConfig):
     holder_weight: float = 0.20
 
 
+# Read-only metadata shared by every "not suitable" hold signal
+_NOT_SUITABLE_METADATA: Mapping[str, Any] = MappingProxyType({"status": "not_suitable"})
+
+
+def _lru_put(cache: "OrderedDict[str, Any]", key: str, value: Any, limit: int):
+    """Store value as the most recently used entry, evicting the oldest past limit."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > limit:
+        cache.popitem(last=False)
+
+
+def _return_stats(prices) -> tuple[int, float, float]:
+    """Count, mean and M2 (sum of squared deviations) of consecutive simple returns."""
+    returns = [
+        (price - prev) / prev
+        for prev, price in zip(prices, islice(prices, 1, None))
+        if prev > 0
+    ]
+    count = len(returns)
+    if not count:
+        return 0, 0.0, 0.0
+    mean = sum(returns) / count
+    return count, mean, sum([(r - mean) * (r - mean) for r in returns])
+
+
+@dataclass(slots=True)
+class _PriceWindow:
+    """Most recent prices of one token with running stats of their returns."""
+
+    prices: deque  # Bounded by maxlen; the oldest price drops off on append
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    evictions: int = 0  # Since count/mean/m2 were last recomputed exactly
+
+    def push(self, price: float):
+        """Append a price, adding its return and retiring the evicted one in O(1)."""
+        prices = self.prices
+        if len(prices) == prices.maxlen:
+            oldest = prices[0]
+            if oldest > 0:
+                self._remove((prices[1] - oldest) / oldest)
+            self.evictions += 1
+        if prices and prices[-1] > 0:
+            prev = prices[-1]
+            self._add((price - prev) / prev)
+        prices.append(price)
+
+        # Removing returns accumulates rounding error; resync once per window
+        if self.evictions >= prices.maxlen:
+            self.count, self.mean, self.m2 = _return_stats(prices)
+            self.evictions = 0
+
+    def volatility(self) -> float:
+        """Population standard deviation of the returns in the window."""
+        if not self.count:
+            return 0.0
+        return (self.m2 / self.count) ** 0.5
+
+    def _add(self, ret: float):
+        self.count += 1
+        delta = ret - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (ret - self.mean)
+
+    def _remove(self, ret: float):
+        count = self.count - 1
+        if count <= 0:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean = (self.count * self.mean - ret) / count
+        # A single remaining return has no spread; don't leave rounding residue
+        self.m2 = 0.0 if count == 1 else max(0.0, self.m2 - (ret - self.mean) * (ret - mean))
+        self.count, self.mean = count, mean
+
+
+@dataclass(slots=True)
+class _QuoteRecord:
+    """Last quote posted for a token."""
+
+    bid: float
+    ask: float
+    spread: float
+    timestamp: float
+
+
+@dataclass(slots=True)
+class _TokenState:
+    """Inventory, rebalance and quote bookkeeping for one token."""
+
+    sol: float = 0.0  # SOL side of the inventory
+    tokens: float = 0.0  # Token side of the inventory
+    last_rebalance: Optional[float] = None  # time.monotonic() of last rebalance
+    last_quote_update: Optional[float] = None  # time.monotonic() of last quote
+    quote: Optional[_QuoteRecord] = None
+
+
+@dataclass(slots=True)
+class _VolatilityState:
+    """Running return statistics for one token's price history."""
+
+    consumed: int = 0  # Prices of the history already folded in
+    first_price: float = 0.0
+    last_price: float = 0.0
+    count: int = 0  # Returns folded in
+    mean: float = 0.0
+    m2: float = 0.0
+    history: Any = None  # The price_history object these stats were built from
+
+
 class MarketMakingStrategy(BaseStrategy):
     """
     Market Making Strategy - Provides liquidity with spread.
@@ -87,47 +204,68 @@ class MarketMakingStrategy(BaseStrategy):
     def __init__(self, config: Optional[MarketMakingConfig] = None):
         """Initialize Market Making Strategy."""
         self.mm_config = config or MarketMakingConfig()
-        super().__init__(self.mm_config)
-        self.strategy_type = StrategyType.MARKET_MAKING
+        super().__init__(self.mm_config, StrategyType.MARKET_MAKING)
 
-        # Inventory tracking
-        self.inventory_sol: Dict[str, float] = {}  # {token: SOL amount}
-        self.inventory_tokens: Dict[str, float] = {}  # {token: token amount}
-        self.last_rebalance: Dict[str, float] = {}  # {token: timestamp}
-
-        # Quote tracking
-        self.active_quotes: Dict[str, Dict[str, Any]] = {}  # {token: {bid, ask, timestamp}}
-        self.last_quote_update: Dict[str, float] = {}  # {token: timestamp}
+        # Inventory and quote tracking, one record per token
+        self.tokens: Dict[str, _TokenState] = {}
 
         # Performance tracking
         self.total_spread_profit = 0.0
         self.rebalances_performed = 0
         self.inventory_imbalances = 0
 
+        # Rolling volatility state per token (see _update_volatility) and
+        # bounded price windows fed by analyze, used when no price_history is
+        # given. Both are LRU-bounded by max_tracked_tokens.
+        self._vol_state: "OrderedDict[str, _VolatilityState]" = OrderedDict()
+        self._price_windows: "OrderedDict[str, _PriceWindow]" = OrderedDict()
+
     async def analyze(self, market_data: Dict[str, Any]) -> StrategySignal:
         """Analyze market data for market making opportunities."""
+        # One monotonic reading per tick drives both interval checks
+        return self._analyze(market_data, time.monotonic())
+
+    async def analyze_batch(self, market_data_list: List[Dict[str, Any]]) -> List[StrategySignal]:
+        """
+        Analyze several tokens from the same tick.
+
+        Args:
+            market_data_list: Market data dicts, one per token
+
+        Returns:
+            One signal per token, in input order
+        """
+        # The whole batch shares one clock reading, as a single tick would
+        current_time = time.monotonic()
+        return [self._analyze(market_data, current_time) for market_data in market_data_list]
+
+    def _analyze(self, market_data: Dict[str, Any], current_time: float) -> StrategySignal:
+        """analyze for one token at a given time.monotonic() reading."""
         token_address = market_data.get("token_address", "")
-        current_time = time.time()
+        price = market_data.get("price")
+        if price is not None:
+            self._feed_price(token_address, price)
 
         # Check if market is suitable for market making
-        should_make_market, mm_data = await self.should_enter(market_data)
+        # analyze builds its own signal reasons, so skip formatting should_enter's
+        should_make_market, mm_data = self._assess_entry(market_data, describe=False)
 
         if not should_make_market:
-            return StrategySignal(
-                strategy_name=self.strategy_type.value,
+            return signal_pool.acquire(
+                strategy_name=self.strategy_value,
                 action="hold",
                 confidence=0.0,
                 position_size=0.0,
                 reason="Market conditions not suitable for market making",
-                metadata={"status": "not_suitable"}
+                metadata=_NOT_SUITABLE_METADATA
             )
 
         # Check if we need to rebalance
-        needs_rebalance = await self._check_rebalance_needed(token_address, market_data)
+        needs_rebalance = self._check_rebalance_needed(token_address, market_data, current_time)
 
         if needs_rebalance:
-            return StrategySignal(
-                strategy_name=self.strategy_type.value,
+            return signal_pool.acquire(
+                strategy_name=self.strategy_value,
                 action="rebalance",
                 confidence=mm_data["confidence"],
                 position_size=mm_data["position_size"],
@@ -136,20 +274,18 @@ class MarketMakingStrategy(BaseStrategy):
             )
 
         # Update quotes if needed
-        if (token_address not in self.last_quote_update or
-            current_time - self.last_quote_update[token_address] >= self.mm_config.quote_update_interval):
+        state = self._state(token_address)
+        if (state.last_quote_update is None or
+            current_time - state.last_quote_update >= self.mm_config.quote_update_interval):
 
             bid_price, ask_price = self._calculate_quotes(market_data)
-            self.active_quotes[token_address] = {
-                "bid": bid_price,
-                "ask": ask_price,
-                "spread": ask_price - bid_price,
-                "timestamp": current_time
-            }
-            self.last_quote_update[token_address] = current_time
-
-            return StrategySignal(
-                strategy_name=self.strategy_type.value,
+            state.quote = _QuoteRecord(
+                bid_price, ask_price, ask_price - bid_price, time.time()
+            )
+            state.last_quote_update = current_time
+
+            return signal_pool.acquire(
+                strategy_name=self.strategy_value,
                 action="update_quotes",
                 confidence=mm_data["confidence"],
                 position_size=mm_data["position_size"],
@@ -161,17 +297,32 @@ class MarketMakingStrategy(BaseStrategy):
                 }
             )
 
-        return StrategySignal(
-            strategy_name=self.strategy_type.value,
+        quote = state.quote
+        quotes = {
+            "bid": quote.bid,
+            "ask": quote.ask,
+            "spread": quote.spread,
+            "timestamp": quote.timestamp,
+        } if quote is not None else {}
+
+        return signal_pool.acquire(
+            strategy_name=self.strategy_value,
             action="hold",
             confidence=mm_data["confidence"],
             position_size=0.0,
             reason="Market making active - waiting for orders",
-            metadata={"status": "active", "quotes": self.active_quotes.get(token_address, {})}
+            metadata={"status": "active", "quotes": quotes}
         )
 
     async def should_enter(self, market_data: Dict[str, Any]) -> tuple[bool, Dict[str, Any]]:
         """Determine if market conditions are suitable for market making."""
+        return self._assess_entry(market_data, describe=True)
+
+    def _assess_entry(
+        self, market_data: Dict[str, Any], describe: bool
+    ) -> tuple[bool, Dict[str, Any]]:
+        """should_enter; the human-readable "reason" is only formatted when describe is set."""
+        token_address = market_data.get("token_address", "")
         liquidity = market_data.get("liquidity_sol", 0)
         volume_24h = market_data.get("volume_24h", 0)
         security_score = market_data.get("security_score", 0)
@@ -179,70 +330,63 @@ class MarketMakingStrategy(BaseStrategy):
         available_capital = market_data.get("available_capital", 0)
         slippage = market_data.get("slippage", 1.0)
 
-        # Calculate volatility if price history available
-        price_history = market_data.get("price_history", [])
-        volatility = self._calculate_volatility(price_history) if price_history else 0.0
+        # Confidence gate: each check gates its weighted score
+        # (bool * weight), so this is one fixed four-term sum with no branches
+        cfg = self.mm_config
+        liquidity_ok = liquidity >= cfg.min_liquidity
+        volume_ok = volume_24h >= cfg.min_volume_24h
+        security_ok = security_score >= cfg.min_security_score
+        holders_ok = holder_count >= cfg.min_holder_count
+        confidence = (
+            liquidity_ok * cfg.liquidity_weight * min(1.0, liquidity / 50.0)
+            + volume_ok * cfg.volume_weight * min(1.0, volume_24h / 500.0)
+            + security_ok * cfg.security_weight * (security_score / 100.0)
+            + holders_ok * cfg.holder_weight * min(1.0, holder_count / 300.0)
+        )
+
+        # Require minimum confidence; nothing below is needed when rejected
+        if confidence < cfg.min_confidence:
+            return False, {}
+
+        volatility = self._volatility(token_address, market_data)
 
         # Entry checks
         checks = {
-            "sufficient_liquidity": liquidity >= self.mm_config.min_liquidity,
-            "adequate_volume": volume_24h >= self.mm_config.min_volume_24h,
-            "security_ok": security_score >= self.mm_config.min_security_score,
-            "enough_holders": holder_count >= self.mm_config.min_holder_count,
-            "low_volatility": volatility <= self.mm_config.volatility_threshold,
-            "acceptable_slippage": slippage <= self.mm_config.max_slippage,
-            "capital_available": available_capital >= self.mm_config.min_trade_size_sol * 2,  # Need capital for both sides
+            "sufficient_liquidity": liquidity_ok,
+            "adequate_volume": volume_ok,
+            "security_ok": security_ok,
+            "enough_holders": holders_ok,
+            "low_volatility": volatility <= cfg.volatility_threshold,
+            "acceptable_slippage": slippage <= cfg.max_slippage,
+            "capital_available": available_capital >= cfg.min_trade_size_sol * 2,  # Need capital for both sides
         }
 
-        # Count passed checks
-        passed_checks = sum(1 for v in checks.values() if v)
-        total_checks = len(checks)
-
-        # Calculate confidence
-        confidence = 0.0
-
-        if checks["sufficient_liquidity"]:
-            liquidity_score = min(1.0, liquidity / 50.0)
-            confidence += self.mm_config.liquidity_weight * liquidity_score
-
-        if checks["adequate_volume"]:
-            volume_score = min(1.0, volume_24h / 500.0)
-            confidence += self.mm_config.volume_weight * volume_score
-
-        if checks["security_ok"]:
-            security_score_normalized = security_score / 100.0
-            confidence += self.mm_config.security_weight * security_score_normalized
-
-        if checks["enough_holders"]:
-            holder_score = min(1.0, holder_count / 300.0)
-            confidence += self.mm_config.holder_weight * holder_score
-
-        # Require minimum confidence
-        if confidence < self.mm_config.min_confidence:
-            return False, {}
-
         # Calculate initial position size
         position_size = min(
             available_capital * 0.3,  # Use 30% of capital
-            self.mm_config.max_trade_size_sol
-        )
-
-        reason = (
-            f"MARKET MAKING: Suitable conditions. "
-            f"Liq: {liquidity:.1f} SOL, Vol: {volume_24h:.1f} SOL, "
-            f"Security: {security_score}/100, Holders: {holder_count}. "
-            f"Volatility: {volatility*100:.1f}%. "
-            f"{passed_checks}/{total_checks} checks passed."
+            cfg.max_trade_size_sol
         )
 
         mm_data = {
             "confidence": confidence,
             "position_size": position_size,
-            "reason": reason,
             "checks": checks,
             "volatility": volatility
         }
 
+        if describe:
+            # Count passed checks
+            passed_checks = sum(checks.values())
+            total_checks = len(checks)
+
+            mm_data["reason"] = (
+                f"MARKET MAKING: Suitable conditions. "
+                f"Liq: {liquidity:.1f} SOL, Vol: {volume_24h:.1f} SOL, "
+                f"Security: {security_score}/100, Holders: {holder_count}. "
+                f"Volatility: {volatility*100:.1f}%. "
+                f"{passed_checks}/{total_checks} checks passed."
+            )
+
         return True, mm_data
 
     async def should_exit(self, market_data: Dict[str, Any], position_data: Dict[str, Any]) -> tuple[bool, str]:
@@ -252,7 +396,6 @@ class MarketMakingStrategy(BaseStrategy):
         entry_price = position_data.get("entry_price", 0)
         liquidity = market_data.get("liquidity_sol", 0)
         security_score = market_data.get("security_score", 100)
-        price_history = market_data.get("price_history", [])
 
         # Calculate P&L
         if entry_price > 0:
@@ -261,19 +404,22 @@ class MarketMakingStrategy(BaseStrategy):
             pnl_percent = 0
 
         # Calculate current volatility
-        volatility = self._calculate_volatility(price_history) if price_history else 0.0
+        volatility = self._volatility(token_address, market_data)
+
+        cfg = self.mm_config
 
         # Exit condition 1: Stop loss
-        if pnl_percent <= -self.mm_config.stop_loss_percentage:
-            return True, f"Stop loss: {pnl_percent*100:.1f}% (limit: -{self.mm_config.stop_loss_percentage*100:.0f}%)"
+        if pnl_percent <= -cfg.stop_loss_percentage:
+            return True, f"Stop loss: {pnl_percent*100:.1f}% (limit: -{cfg.stop_loss_percentage*100:.0f}%)"
 
         # Exit condition 2: High volatility
-        if volatility > self.mm_config.volatility_threshold:
-            return True, f"High volatility: {volatility*100:.1f}% (threshold: {self.mm_config.volatility_threshold*100:.0f}%)"
+        if volatility > cfg.volatility_threshold:
+            return True, f"High volatility: {volatility*100:.1f}% (threshold: {cfg.volatility_threshold*100:.0f}%)"
 
         # Exit condition 3: Liquidity drain
-        if liquidity < self.mm_config.min_liquidity * 0.5:
-            return True, f"Liquidity drain: {liquidity:.1f} SOL (threshold: {self.mm_config.min_liquidity * 0.5:.1f})"
+        drain_floor = cfg.min_liquidity * 0.5
+        if liquidity < drain_floor:
+            return True, f"Liquidity drain: {liquidity:.1f} SOL (threshold: {drain_floor:.1f})"
 
         # Exit condition 4: Security degradation
         if security_score < 40:
@@ -281,56 +427,59 @@ class MarketMakingStrategy(BaseStrategy):
 
         # Exit condition 5: Threat detection
         threat_detected = market_data.get("threats", {})
-        critical_threats = [t for t in threat_detected.values() if t and t[0] == "critical"]
-        if critical_threats:
-            return True, f"Critical threat: {critical_threats[0][2].get('reason', 'Unknown')}"
+        critical = next((t for t in threat_detected.values() if t and t[0] == "critical"), None)
+        if critical is not None:
+            return True, f"Critical threat: {critical[2].get('reason', 'Unknown')}"
 
         return False, ""
 
-    async def _check_rebalance_needed(self, token_address: str, market_data: Dict[str, Any]) -> bool:
-        """Check if inventory needs rebalancing."""
-        current_time = time.time()
+    def _check_rebalance_needed(
+        self, token_address: str, market_data: Dict[str, Any], current_time: float
+    ) -> bool:
+        """Check if inventory needs rebalancing (current_time is time.monotonic())."""
+        state = self.tokens.get(token_address)
+        if state is None:
+            return False
+        cfg = self.mm_config
 
         # Check rebalance interval
-        if token_address in self.last_rebalance:
-            if current_time - self.last_rebalance[token_address] < self.mm_config.rebalance_interval:
+        if state.last_rebalance is not None:
+            if current_time - state.last_rebalance < cfg.rebalance_interval:
                 return False
 
-        # Calculate inventory ratio
-        sol_value = self.inventory_sol.get(token_address, 0)
-        token_value = self.inventory_tokens.get(token_address, 0) * market_data.get("price", 0)
-        total_value = sol_value + token_value
-
-        if total_value == 0:
-            return False
-
-        current_ratio = sol_value / total_value
-        target_ratio = self.mm_config.target_sol_ratio
-
         # Check if rebalance needed
-        if abs(current_ratio - target_ratio) > self.mm_config.rebalance_threshold:
-            self.last_rebalance[token_address] = current_time
+        if self._inventory_drift(state, market_data.get("price", 0)) > cfg.rebalance_threshold:
+            state.last_rebalance = current_time
             self.rebalances_performed += 1
             self.inventory_imbalances += 1
             return True
 
         return False
 
+    def _inventory_drift(self, state: _TokenState, price: float) -> float:
+        """Distance of the SOL share of inventory from target_sol_ratio (0.0 when empty)."""
+        sol_value = state.sol
+        total_value = sol_value + state.tokens * price
+        if total_value == 0:
+            return 0.0
+        return abs(sol_value / total_value - self.mm_config.target_sol_ratio)
+
     def _calculate_quotes(self, market_data: Dict[str, Any]) -> tuple[float, float]:
         """Calculate bid and ask prices with spread."""
+        token_address = market_data.get("token_address", "")
         current_price = market_data.get("price", 0)
-        price_history = market_data.get("price_history", [])
 
         # Calculate volatility-adjusted spread
-        volatility = self._calculate_volatility(price_history) if price_history else 0.0
-        spread = self.mm_config.spread_percentage
+        volatility = self._volatility(token_address, market_data)
+        cfg = self.mm_config
+        spread = cfg.spread_percentage
 
         # Increase spread in high volatility
         if volatility > 0.15:  # 15% volatility
             spread *= 1 + (volatility - 0.15) * 2  # Increase spread proportionally
 
         # Ensure spread within bounds
-        spread = max(self.mm_config.min_spread, min(spread, self.mm_config.max_spread))
+        spread = max(cfg.min_spread, min(spread, cfg.max_spread))
 
         # Calculate bid/ask
         bid_price = current_price * (1 - spread / 2)
@@ -338,27 +487,88 @@ class MarketMakingStrategy(BaseStrategy):
 
         return bid_price, ask_price
 
-    def _calculate_volatility(self, price_history: list) -> float:
-        """Calculate price volatility from history."""
-        if len(price_history) < 2:
-            return 0.0
-
-        # Calculate returns
-        returns = []
-        for i in range(1, len(price_history)):
-            if price_history[i-1] > 0:
-                ret = (price_history[i] - price_history[i-1]) / price_history[i-1]
-                returns.append(ret)
+    def _state(self, token_address: str) -> _TokenState:
+        """Return the bookkeeping record for a token, creating it on first use."""
+        state = self.tokens.get(token_address)
+        if state is None:
+            state = self.tokens[token_address] = _TokenState()
+        return state
+
+    def _feed_price(self, token_address: str, price: float):
+        """Append this tick's price to the token's bounded window."""
+        window = self._price_windows.get(token_address)
+        if window is None:
+            window = _PriceWindow(deque(maxlen=max(2, self.mm_config.price_window)))
+        _lru_put(self._price_windows, token_address, window, self.mm_config.max_tracked_tokens)
+        window.push(price)
+
+    def _volatility(self, token_address: str, market_data: Dict[str, Any]) -> float:
+        """Volatility from the caller's price_history, else from the fed price window."""
+        price_history = market_data.get("price_history")
+        if price_history:
+            return self._update_volatility(token_address, price_history)
+        window = self._price_windows.get(token_address)
+        return window.volatility() if window is not None else 0.0
+
+    def _update_volatility(self, token_address: str, price_history: list) -> float:
+        """
+        Volatility of price_history, folding in only prices added since the last call.
+
+        Uses Welford's running mean/M2 over the same per-step returns as
+        _calculate_volatility. The incremental path is only taken when
+        price_history is the same object as last time and has grown, so an
+        append-only history costs O(new prices). Anything else (a new list, an
+        unchanged length, a sliding window, changed endpoints) is rebuilt from
+        scratch, as is any call without a token address to key state on.
+        """
+        if not token_address:
+            return self._calculate_volatility(price_history)
+
+        size = len(price_history)
+        state = self._vol_state.get(token_address)
+        if (
+            state is None
+            or state.history is not price_history
+            or size <= state.consumed
+            or price_history[0] != state.first_price
+            or price_history[state.consumed - 1] != state.last_price
+        ):
+            # Full rebuild with the two-pass kernel; it beats an element-wise
+            # Welford loop on a whole history
+            count, mean, m2 = _return_stats(price_history)
+            state = _VolatilityState(
+                size, price_history[0] if size else 0.0,
+                price_history[-1] if size else 0.0, count, mean, m2, price_history,
+            )
+            _lru_put(self._vol_state, token_address, state, self.mm_config.max_tracked_tokens)
 
-        if not returns:
+        else:
+            self._vol_state.move_to_end(token_address)
+            # Same object, grown, consumed prefix still in place: fold in the tail
+            prev = state.last_price
+            count, mean, m2 = state.count, state.mean, state.m2
+            for price in islice(price_history, state.consumed, None):
+                if prev > 0:
+                    ret = (price - prev) / prev
+                    count += 1
+                    delta = ret - mean
+                    mean += delta / count
+                    m2 += delta * (ret - mean)
+                prev = price
+            state.consumed = size
+            state.last_price = prev
+            state.count, state.mean, state.m2 = count, mean, m2
+
+        if not state.count:
             return 0.0
+        return (state.m2 / state.count) ** 0.5
 
-        # Calculate standard deviation
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        volatility = variance ** 0.5
-
-        return volatility
+    def _calculate_volatility(self, price_history: list) -> float:
+        """Calculate price volatility from history."""
+        count, _, m2 = _return_stats(price_history)
+        if not count:
+            return 0.0
+        return (m2 / count) ** 0.5
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get strategy performance statistics."""
@@ -368,7 +578,7 @@ class MarketMakingStrategy(BaseStrategy):
         stats["total_spread_profit"] = self.total_spread_profit
         stats["rebalances_performed"] = self.rebalances_performed
         stats["inventory_imbalances"] = self.inventory_imbalances
-        stats["active_markets"] = len(self.active_quotes)
+        stats["active_markets"] = sum(1 for state in self.tokens.values() if state.quote is not None)
 
         return stats
 
@@ -383,8 +593,9 @@ class MarketMakingStrategy(BaseStrategy):
         await super().on_trade_enter(token_address, entry_price, position_size, confidence)
 
         # Initialize inventory
-        self.inventory_sol[token_address] = position_size / 2  # Half in SOL
-        self.inventory_tokens[token_address] = (position_size / 2) / entry_price  # Half in tokens
+        state = self._state(token_address)
+        state.sol = position_size / 2  # Half in SOL
+        state.tokens = (position_size / 2) / entry_price  # Half in tokens
 
     async def on_trade_exit(
         self,
@@ -410,7 +621,11 @@ class MarketMakingStrategy(BaseStrategy):
             spread_profit = (exit_price - entry_price) * position_size
             self.total_spread_profit += spread_profit
 
-        # Clean up
-        self.inventory_sol.pop(token_address, None)
-        self.inventory_tokens.pop(token_address, None)
-        self.active_quotes.pop(token_address, None)
+        # Clean up (interval timestamps are kept so quoting/rebalancing stay throttled)
+        state = self.tokens.get(token_address)
+        if state is not None:
+            state.sol = 0.0
+            state.tokens = 0.0
+            state.quote = None
+        self._vol_state.pop(token_address, None)
+        self._price_windows.pop(token_address, None)
@@ -15,7 +15,9 @@ from .base_strategy import (
     BaseStrategy,
     StrategySignal,
     StrategyConfig,
-    StrategyType
+    StrategyType,
+    format_exit_reason,
+    signal_pool,
 )
 
 logger = logging.getLogger(__name__)
@@ -245,7 +247,7 @@ class MomentumStrategy(BaseStrategy):
         # Check if we have enough data
         price_count = len(self._price_history.get(token_address, []))
         if price_count < self.momentum_config.min_data_points:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -261,7 +263,7 @@ class MomentumStrategy(BaseStrategy):
         has_price_momentum, price_change = self._check_price_momentum(token_address)
 
         if rsi is None:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -315,7 +317,7 @@ class MomentumStrategy(BaseStrategy):
             position_size = self.calculate_position_size(available_capital, market_data)
 
             if position_size < 0.1:
-                return StrategySignal(
+                return signal_pool.acquire(
                     strategy_name=self.name,
                     action="hold",
                     confidence=confidence,
@@ -324,7 +326,7 @@ class MomentumStrategy(BaseStrategy):
                     metadata={"token_address": token_address}
                 )
 
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="buy",
                 confidence=confidence,
@@ -343,7 +345,7 @@ class MomentumStrategy(BaseStrategy):
 
         # No momentum or confidence too low
         failed_checks = [k for k, v in checks.items() if not v]
-        return StrategySignal(
+        return signal_pool.acquire(
             strategy_name=self.name,
             action="hold",
             confidence=confidence,
@@ -360,7 +362,9 @@ class MomentumStrategy(BaseStrategy):
     async def should_enter(self, token_address: str, market_data: Dict[str, Any]) -> bool:
         """Check if we should enter a momentum position"""
         signal = await self.analyze(market_data)
-        return signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        enter = signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        signal_pool.release(signal)
+        return enter
 
     async def should_exit(self, position: Dict[str, Any], market_data: Dict[str, Any]) -> bool:
         """Check if we should exit a momentum position"""
@@ -368,9 +372,10 @@ class MomentumStrategy(BaseStrategy):
         current_time = time.time()
 
         # Check standard exit conditions
-        should_exit, reason = self.check_exit_conditions(position, current_price, current_time)
-        if should_exit:
-            logger.info(f"Momentum exit triggered: {reason}")
+        code, value = self.check_exit_code(position, current_price, current_time)
+        if code:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Momentum exit triggered: %s", format_exit_reason(code, value))
             return True
 
         # Momentum-specific exit conditions
@@ -16,7 +16,9 @@ from .base_strategy import (
     BaseStrategy,
     StrategySignal,
     StrategyConfig,
-    StrategyType
+    StrategyType,
+    format_exit_reason,
+    signal_pool,
 )
 
 logger = logging.getLogger(__name__)
@@ -287,7 +289,7 @@ class ReversalStrategy(BaseStrategy):
         # Check if we have enough data
         data_count = len(self._price_history.get(token_address, []))
         if data_count < self.reversal_config.min_data_points:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -299,7 +301,7 @@ class ReversalStrategy(BaseStrategy):
         # Detect dip
         dip_info = self._detect_dip(token_address, price, volume, timestamp)
         if dip_info is None:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -371,7 +373,7 @@ class ReversalStrategy(BaseStrategy):
             position_size = self.calculate_position_size(available_capital, market_data)
 
             if position_size < 0.1:
-                return StrategySignal(
+                return signal_pool.acquire(
                     strategy_name=self.name,
                     action="hold",
                     confidence=confidence,
@@ -380,7 +382,7 @@ class ReversalStrategy(BaseStrategy):
                     metadata={"token_address": token_address}
                 )
 
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="buy",
                 confidence=confidence,
@@ -399,7 +401,7 @@ class ReversalStrategy(BaseStrategy):
 
         # Not a good reversal opportunity
         failed_checks = [k for k, v in checks.items() if not v]
-        return StrategySignal(
+        return signal_pool.acquire(
             strategy_name=self.name,
             action="hold",
             confidence=confidence,
@@ -415,7 +417,9 @@ class ReversalStrategy(BaseStrategy):
     async def should_enter(self, token_address: str, market_data: Dict[str, Any]) -> bool:
         """Check if we should enter on a dip"""
         signal = await self.analyze(market_data)
-        return signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        enter = signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        signal_pool.release(signal)
+        return enter
 
     async def should_exit(self, position: Dict[str, Any], market_data: Dict[str, Any]) -> bool:
         """Check if we should exit at a peak"""
@@ -424,9 +428,10 @@ class ReversalStrategy(BaseStrategy):
         current_volume = market_data.get("volume_1h", 0.0)
 
         # Check standard exit conditions
-        should_exit, reason = self.check_exit_conditions(position, current_price, current_time)
-        if should_exit:
-            logger.info(f"Reversal exit triggered: {reason}")
+        code, value = self.check_exit_code(position, current_price, current_time)
+        if code:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Reversal exit triggered: %s", format_exit_reason(code, value))
             return True
 
         # Reversal-specific exit conditions
@@ -14,7 +14,9 @@ from .base_strategy import (
     BaseStrategy,
     StrategySignal,
     StrategyConfig,
-    StrategyType
+    StrategyType,
+    format_exit_reason,
+    signal_pool,
 )
 
 logger = logging.getLogger(__name__)
@@ -85,7 +87,7 @@ class SnipeStrategy(BaseStrategy):
 
         # Check if we've already seen this token
         if token_address in self._seen_tokens:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -98,7 +100,7 @@ class SnipeStrategy(BaseStrategy):
         if token_address in self._failed_snipes:
             fail_time = self._failed_snipes[token_address]
             if time.time() - fail_time < 3600:  # 1 hour cooldown
-                return StrategySignal(
+                return signal_pool.acquire(
                     strategy_name=self.name,
                     action="hold",
                     confidence=0.0,
@@ -182,7 +184,7 @@ class SnipeStrategy(BaseStrategy):
             position_size = self.calculate_position_size(available_capital, market_data)
 
             if position_size < 0.1:  # Minimum viable position
-                return StrategySignal(
+                return signal_pool.acquire(
                     strategy_name=self.name,
                     action="hold",
                     confidence=confidence,
@@ -195,7 +197,7 @@ class SnipeStrategy(BaseStrategy):
                     }
                 )
 
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="buy",
                 confidence=confidence,
@@ -214,7 +216,7 @@ class SnipeStrategy(BaseStrategy):
 
         # Not a good snipe opportunity
         failed_checks = [k for k, v in checks.items() if not v]
-        return StrategySignal(
+        return signal_pool.acquire(
             strategy_name=self.name,
             action="hold",
             confidence=confidence,
@@ -230,7 +232,9 @@ class SnipeStrategy(BaseStrategy):
     async def should_enter(self, token_address: str, market_data: Dict[str, Any]) -> bool:
         """Check if we should enter a snipe position"""
         signal = await self.analyze(market_data)
-        return signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        enter = signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        signal_pool.release(signal)
+        return enter
 
     async def should_exit(self, position: Dict[str, Any], market_data: Dict[str, Any]) -> bool:
         """Check if we should exit a snipe position"""
@@ -238,9 +242,10 @@ class SnipeStrategy(BaseStrategy):
         current_time = time.time()
 
         # Check standard exit conditions
-        should_exit, reason = self.check_exit_conditions(position, current_price, current_time)
-        if should_exit:
-            logger.info(f"Snipe exit triggered: {reason}")
+        code, value = self.check_exit_code(position, current_price, current_time)
+        if code:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Snipe exit triggered: %s", format_exit_reason(code, value))
             return True
 
         # Snipe-specific exit conditions
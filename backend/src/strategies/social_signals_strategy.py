@@ -14,7 +14,9 @@ from .base_strategy import (
     BaseStrategy,
     StrategySignal,
     StrategyConfig,
-    StrategyType
+    StrategyType,
+    format_exit_reason,
+    signal_pool,
 )
 
 logger = logging.getLogger(__name__)
@@ -201,7 +203,7 @@ class SocialSignalsStrategy(BaseStrategy):
         # Extract social signal data
         social_data = market_data.get("social_signals")
         if not social_data:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -230,7 +232,7 @@ class SocialSignalsStrategy(BaseStrategy):
         # Check signal freshness
         signal_age = time.time() - signal_timestamp
         if signal_age > self.social_config.max_signal_age:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -241,7 +243,7 @@ class SocialSignalsStrategy(BaseStrategy):
 
         # Check for scam keywords
         if self._detect_scam_keywords(top_keywords):
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -322,7 +324,7 @@ class SocialSignalsStrategy(BaseStrategy):
             position_size = self.calculate_position_size(available_capital, market_data)
 
             if position_size < 0.1:
-                return StrategySignal(
+                return signal_pool.acquire(
                     strategy_name=self.name,
                     action="hold",
                     confidence=confidence,
@@ -331,7 +333,7 @@ class SocialSignalsStrategy(BaseStrategy):
                     metadata={"token_address": token_address}
                 )
 
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="buy",
                 confidence=confidence,
@@ -353,7 +355,7 @@ class SocialSignalsStrategy(BaseStrategy):
 
         # No strong signal
         failed_checks = [k for k, v in checks.items() if not v]
-        return StrategySignal(
+        return signal_pool.acquire(
             strategy_name=self.name,
             action="hold",
             confidence=confidence,
@@ -370,7 +372,9 @@ class SocialSignalsStrategy(BaseStrategy):
     async def should_enter(self, token_address: str, market_data: Dict[str, Any]) -> bool:
         """Check if we should enter based on social signals"""
         signal = await self.analyze(market_data)
-        return signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        enter = signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        signal_pool.release(signal)
+        return enter
 
     async def should_exit(self, position: Dict[str, Any], market_data: Dict[str, Any]) -> bool:
         """Check if we should exit based on social signal changes"""
@@ -378,9 +382,10 @@ class SocialSignalsStrategy(BaseStrategy):
         current_time = time.time()
 
         # Check standard exit conditions
-        should_exit, reason = self.check_exit_conditions(position, current_price, current_time)
-        if should_exit:
-            logger.info(f"Social signals exit triggered: {reason}")
+        code, value = self.check_exit_code(position, current_price, current_time)
+        if code:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Social signals exit triggered: %s", format_exit_reason(code, value))
             return True
 
         # Social-specific exit conditions
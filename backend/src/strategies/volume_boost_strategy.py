@@ -15,6 +15,7 @@ from strategies.base_strategy import (
     StrategyType,
     StrategySignal,
     StrategyConfig,
+    signal_pool,
 )
 
 
@@ -72,8 +73,7 @@ class VolumeBoostStrategy(BaseStrategy):
     def __init__(self, config: Optional[VolumeBoostConfig] = None):
         """Initialize Volume Boost Strategy."""
         self.volume_config = config or VolumeBoostConfig()
-        super().__init__(self.volume_config)
-        self.strategy_type = StrategyType.VOLUME_BOOST
+        super().__init__(self.volume_config, StrategyType.VOLUME_BOOST)
 
         # Volume tracking
         self.volume_history: Dict[str, Deque[tuple[float, float]]] = {}  # {token: deque[(timestamp, volume)]}
@@ -89,8 +89,8 @@ class VolumeBoostStrategy(BaseStrategy):
 
         # Skip if already processed
         if token_address in self.processed_tokens:
-            return StrategySignal(
-                strategy_name=self.strategy_type.value,
+            return signal_pool.acquire(
+                strategy_name=self.strategy_value,
                 action="hold",
                 confidence=0.0,
                 position_size=0.0,
@@ -105,8 +105,8 @@ class VolumeBoostStrategy(BaseStrategy):
             self.processed_tokens.add(token_address)
             self.volume_spikes_detected += 1
 
-            return StrategySignal(
-                strategy_name=self.strategy_type.value,
+            return signal_pool.acquire(
+                strategy_name=self.strategy_value,
                 action="buy",
                 confidence=entry_data["confidence"],
                 position_size=entry_data["position_size"],
@@ -114,8 +114,8 @@ class VolumeBoostStrategy(BaseStrategy):
                 metadata=entry_data["checks"]
             )
 
-        return StrategySignal(
-            strategy_name=self.strategy_type.value,
+        return signal_pool.acquire(
+            strategy_name=self.strategy_value,
             action="hold",
             confidence=0.0,
             position_size=0.0,
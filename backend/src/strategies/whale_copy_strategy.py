@@ -14,7 +14,9 @@ from .base_strategy import (
     BaseStrategy,
     StrategySignal,
     StrategyConfig,
-    StrategyType
+    StrategyType,
+    format_exit_reason,
+    signal_pool,
 )
 
 logger = logging.getLogger(__name__)
@@ -208,7 +210,7 @@ class WhaleCopyStrategy(BaseStrategy):
         # Extract whale trade information
         whale_trade = market_data.get("whale_trade")
         if not whale_trade:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -226,7 +228,7 @@ class WhaleCopyStrategy(BaseStrategy):
 
         # Only copy buy actions (sells are handled in exit logic)
         if action != "buy":
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -237,7 +239,7 @@ class WhaleCopyStrategy(BaseStrategy):
 
         # Check if whale is tracked and qualified
         if whale_address not in self._whale_scores:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -252,7 +254,7 @@ class WhaleCopyStrategy(BaseStrategy):
         # Check trade freshness
         trade_age = time.time() - trade_timestamp
         if trade_age > self.whale_config.max_copy_delay:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=0.0,
@@ -297,7 +299,7 @@ class WhaleCopyStrategy(BaseStrategy):
             copy_amount = available_capital
 
         if copy_amount < self.whale_config.min_copy_amount:
-            return StrategySignal(
+            return signal_pool.acquire(
                 strategy_name=self.name,
                 action="hold",
                 confidence=confidence,
@@ -325,7 +327,7 @@ class WhaleCopyStrategy(BaseStrategy):
             whale_recent_performance=recent_success_rate,
         )
 
-        return StrategySignal(
+        return signal_pool.acquire(
             strategy_name=self.name,
             action="buy",
             confidence=confidence,
@@ -345,7 +347,9 @@ class WhaleCopyStrategy(BaseStrategy):
     async def should_enter(self, token_address: str, market_data: Dict[str, Any]) -> bool:
         """Check if we should copy a whale's entry"""
         signal = await self.analyze(market_data)
-        return signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        enter = signal.action == "buy" and signal.confidence >= self.config.min_confidence
+        signal_pool.release(signal)
+        return enter
 
     async def should_exit(self, position: Dict[str, Any], market_data: Dict[str, Any]) -> bool:
         """Check if we should exit a copied position"""
@@ -354,9 +358,10 @@ class WhaleCopyStrategy(BaseStrategy):
         token_address = position.get("token_address")
 
         # Check standard exit conditions
-        should_exit, reason = self.check_exit_conditions(position, current_price, current_time)
-        if should_exit and self.whale_config.use_independent_exits:
-            logger.info(f"Whale copy exit triggered: {reason}")
+        code, value = self.check_exit_code(position, current_price, current_time)
+        if code and self.whale_config.use_independent_exits:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Whale copy exit triggered: %s", format_exit_reason(code, value))
             return True
 
         # Check if whale has exited
@@ -14,6 +14,7 @@ Tests:
 import pytest
 import asyncio
 import time
+from types import MappingProxyType
 from unittest.mock import Mock, AsyncMock, patch
 
 # Import strategies
@@ -22,6 +23,7 @@ sys.path.insert(0, '/home/user/Solberus/backend/src')
 
 from strategies.base_strategy import (
     BaseStrategy,
+    SignalPool,
     StrategySignal,
     StrategyConfig,
     StrategyPerformance,
@@ -32,6 +34,7 @@ from strategies.momentum_strategy import MomentumStrategy, MomentumConfig
 from strategies.reversal_strategy import ReversalStrategy, ReversalConfig
 from strategies.whale_copy_strategy import WhaleCopyStrategy, WhaleCopyConfig
 from strategies.social_signals_strategy import SocialSignalsStrategy, SocialSignalsConfig
+from strategies.market_making_strategy import MarketMakingStrategy, MarketMakingConfig
 
 
 # ============================================================================
@@ -154,6 +157,80 @@ def test_strategy_performance():
     assert perf.get_avg_pnl() == 1.0
 
 
+def test_signal_pool_acquire_release():
+    """Test SignalPool reuses released signals and rebinds every field"""
+    pool = SignalPool(size=2)
+
+    signal = pool.acquire("A", "buy", 0.9, 1.0, "first", {"k": 1}, timestamp=1.0)
+    assert signal.action == "buy"
+    assert signal.metadata == {"k": 1}
+
+    pool.release(signal)
+    reused = pool.acquire("B", "hold", 0.0, 0.0, "second", timestamp=2.0)
+
+    assert reused is signal
+    assert reused.strategy_name == "B"
+    assert reused.action == "hold"
+    assert reused.confidence == 0.0
+    assert reused.reason == "second"
+    assert reused.timestamp == 2.0
+    assert reused.metadata == {}
+
+    # Empty pool falls back to a fresh instance
+    assert pool.acquire("C", "sell", 0.5, 1.0, "third") is not signal
+
+
+def test_signal_pool_is_bounded():
+    """Test SignalPool keeps at most `size` released signals"""
+    pool = SignalPool(size=1)
+    first = pool.acquire("A", "buy", 0.9, 1.0, "a")
+    second = pool.acquire("A", "buy", 0.9, 1.0, "b")
+    pool.release(first)
+    pool.release(second)
+
+    assert pool.acquire("A", "hold", 0.0, 0.0, "c") is second
+    assert pool.acquire("A", "hold", 0.0, 0.0, "d") not in (first, second)
+
+
+def test_signal_metadata_isolated_across_reuse():
+    """Test metadata written before release does not leak into the next use"""
+    pool = SignalPool()
+    signal = pool.acquire("A", "buy", 0.9, 1.0, "first")
+    signal.set_metadata("token", "abc")
+    pool.release(signal)
+
+    reused = pool.acquire("A", "hold", 0.0, 0.0, "second")
+    assert reused is signal
+    assert "token" not in reused.metadata
+
+    # The shared empty default must not have been written through
+    other = pool.acquire("A", "hold", 0.0, 0.0, "third")
+    assert other.metadata == {}
+
+
+def test_signal_metadata_copy_on_write():
+    """Test set_metadata and to_dict copy read-only shared metadata"""
+    shared = MappingProxyType({"token": "abc"})
+    first = StrategySignal("A", "buy", 0.9, 1.0, "a", shared)
+    second = StrategySignal("A", "buy", 0.9, 1.0, "b", shared)
+
+    as_dict = first.to_dict()["metadata"]
+    assert type(as_dict) is dict
+    assert as_dict == {"token": "abc"}
+
+    first.set_metadata("extra", 1)
+    assert first.metadata == {"token": "abc", "extra": 1}
+    assert type(first.metadata) is dict
+    assert dict(shared) == {"token": "abc"}
+    assert second.metadata is shared
+
+    # Plain dict metadata is written in place
+    owned = {"token": "abc"}
+    third = StrategySignal("A", "buy", 0.9, 1.0, "c", owned)
+    third.set_metadata("extra", 2)
+    assert third.metadata is owned
+
+
 # ============================================================================
 # SNIPE STRATEGY TESTS
 # ============================================================================
@@ -561,6 +638,71 @@ async def test_strategy_performance_tracking():
     print(f"✅ Performance tracking: {stats['trades']} trades, {stats['win_rate']:.0%} win rate")
 
 
+# ============================================================================
+# MARKET MAKING STRATEGY TESTS
+# ============================================================================
+
+def test_market_making_volatility_sliding_window_same_ends():
+    """A history rewritten in place with the same endpoints must not reuse stale stats"""
+    strategy = MarketMakingStrategy()
+    history = [1.0, 5.0, 1.0, 9.0]
+    strategy._update_volatility("token1", history)
+
+    history[:] = [1.0, 9.0, 1.0, 9.0]
+    assert strategy._update_volatility("token1", history) == pytest.approx(
+        strategy._calculate_volatility(history)
+    )
+
+    # A new list with the same endpoints is rebuilt as well
+    fresh = [1.0, 2.0, 3.0, 9.0]
+    assert strategy._update_volatility("token1", fresh) == pytest.approx(
+        strategy._calculate_volatility(fresh)
+    )
+
+
+def test_market_making_volatility_append_only():
+    """Appending to the same list folds in new prices and matches a full recompute"""
+    strategy = MarketMakingStrategy()
+    history = [1.0]
+    for price in [1.1, 0.9, 0.0, 1.2, 1.3, 1.25, 0.95]:
+        history.append(price)
+        assert strategy._update_volatility("token1", history) == pytest.approx(
+            strategy._calculate_volatility(history), abs=1e-12
+        )
+
+
+def test_market_making_volatility_without_token_address():
+    """Histories without a token address never share volatility state"""
+    strategy = MarketMakingStrategy()
+    calm = [1.0, 1.0, 1.0, 1.0]
+    wild = [1.0, 2.0, 0.5, 3.0]
+
+    assert strategy._update_volatility("", calm) == 0.0
+    assert strategy._update_volatility("", wild) == pytest.approx(
+        strategy._calculate_volatility(wild)
+    )
+    assert "" not in strategy._vol_state
+
+
+@pytest.mark.asyncio
+async def test_market_making_tracked_tokens_bounded():
+    """Per-token price windows and volatility state stay within max_tracked_tokens"""
+    strategy = MarketMakingStrategy(MarketMakingConfig(max_tracked_tokens=3))
+
+    for i in range(10):
+        strategy._feed_price(f"token{i}", 1.0)
+        strategy._update_volatility(f"token{i}", [1.0, 1.1, 1.2])
+
+    assert list(strategy._price_windows) == ["token7", "token8", "token9"]
+    assert list(strategy._vol_state) == ["token7", "token8", "token9"]
+
+    # Exiting a position drops its window and volatility state
+    await strategy.on_trade_enter("token9", 1.0, 1.0, 0.9)
+    await strategy.on_trade_exit("token9", 1.0, 1.1, 1.0, 60.0, 0.9)
+    assert "token9" not in strategy._price_windows
+    assert "token9" not in strategy._vol_state
+
+
 # ============================================================================
 # RUN ALL TESTS
 # ============================================================================
@@ -0,0 +1,66 @@
+"""
+Tests for StrategyCombinator with real TokenInfo instances
+"""
+
+import pytest
+from unittest.mock import patch
+
+# Add src to path
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from solders.pubkey import Pubkey
+
+from interfaces.core import Platform, TokenInfo
+from strategies.base_strategy import StrategyType
+from strategies.combinator import StrategyCombinator, StrategyConfig, _market_snapshot
+from strategies.momentum_strategy import MomentumStrategy
+
+
+@pytest.fixture
+def token_info():
+    """A TokenInfo as produced by the listeners (no optional market data)"""
+    return TokenInfo(
+        name="Test",
+        symbol="TEST",
+        uri="https://example.com/test.json",
+        mint=Pubkey.new_unique(),
+        platform=Platform.PUMP_FUN,
+        creation_timestamp=1_000.0,
+    )
+
+
+def test_market_snapshot_reads_token_info(token_info):
+    """Test the snapshot uses TokenInfo's mint and creation_timestamp"""
+    snapshot = _market_snapshot(token_info, 1_030.0)
+
+    assert snapshot.token_address == str(token_info.mint)
+    assert snapshot.age_seconds == 30
+    assert snapshot.liquidity_sol == 0.0
+    assert snapshot.volume_24h == 0.0
+
+
+def test_market_snapshot_without_creation_timestamp(token_info):
+    """Test an unknown creation time yields age 0 instead of failing"""
+    token_info.creation_timestamp = None
+
+    assert _market_snapshot(token_info, 1_030.0).age_seconds == 0
+
+
+@pytest.mark.asyncio
+async def test_combinator_runs_strategies_for_token_info(token_info):
+    """Test execute_combined_strategy reaches the strategies for a real TokenInfo"""
+    combinator = StrategyCombinator(
+        [StrategyConfig(StrategyType.MOMENTUM, capital_allocation=1.0)]
+    )
+
+    with patch.object(MomentumStrategy, "analyze", autospec=True) as analyze:
+        analyze.return_value.action = "hold"
+        result = await combinator.execute_combined_strategy(token_info, now=1_030.0)
+
+    assert result.error_message is None
+    analyze.assert_called_once()
+    market_data = analyze.call_args.args[1]
+    assert market_data["token_address"] == str(token_info.mint)
+    assert market_data["age_seconds"] == 30
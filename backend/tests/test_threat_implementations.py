@@ -0,0 +1,164 @@
+"""
+Unit tests for threat detection kernels
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from security.threat_implementations import (
+    ACTION_BUY,
+    ACTION_SELL,
+    ThreatContext,
+    ThreatDetectionMethods,
+    TxBatch,
+    _PROGRAM_CACHE,
+    _find_sandwich_pairs,
+    _parse_token_metadata,
+)
+
+
+def _batch(rows):
+    """Build a TxBatch from (slot, tx_index, signer, action) rows."""
+    txs = TxBatch()
+    for slot, tx_index, signer, action in rows:
+        txs.append(slot, tx_index, signer, action, 1.0, float(slot))
+    return txs
+
+
+class TestFindSandwichPairs:
+    """Test suite for _find_sandwich_pairs."""
+
+    def test_buy_victim_sell(self):
+        """Attacker buy, victim buy, attacker sell in one slot is a pair."""
+        pairs = _find_sandwich_pairs(
+            [5, 5, 5], [0, 1, 0], [ACTION_BUY, ACTION_BUY, ACTION_SELL]
+        )
+        assert pairs == [(0, 2)]
+
+    def test_sell_victim_buy(self):
+        """The mirrored sell/sell/buy pattern is also a pair."""
+        pairs = _find_sandwich_pairs(
+            [5, 5, 5], [0, 1, 0], [ACTION_SELL, ACTION_SELL, ACTION_BUY]
+        )
+        assert pairs == [(0, 2)]
+
+    def test_requires_victim_in_between(self):
+        """A round trip with no other same-direction trade between is not a pair."""
+        pairs = _find_sandwich_pairs(
+            [5, 5, 5], [0, 1, 0], [ACTION_BUY, ACTION_SELL, ACTION_SELL]
+        )
+        assert pairs == []
+
+    def test_requires_same_slot(self):
+        """Front and back legs in different slots are not a pair."""
+        pairs = _find_sandwich_pairs(
+            [5, 5, 6], [0, 1, 0], [ACTION_BUY, ACTION_BUY, ACTION_SELL]
+        )
+        assert pairs == []
+
+
+class TestParseTokenMetadata:
+    """Test suite for _parse_token_metadata."""
+
+    def test_parses_bytes(self):
+        """A JSON object body is returned as a dict."""
+        raw = '{"name": "T", "description": "caf\u00e9"}'.encode()
+        assert _parse_token_metadata(raw) == {"name": "T", "description": "caf\u00e9"}
+
+    def test_non_object_is_ignored(self):
+        """Bodies that are not JSON objects yield None."""
+        assert _parse_token_metadata(b"[1, 2]") is None
+
+
+class TestTxBatch:
+    """Test suite for TxBatch."""
+
+    def test_block_order_sorts_by_slot_then_index(self):
+        """block_order returns indices ordered by (slot, tx_index)."""
+        txs = _batch([
+            (7, 1, "a", ACTION_BUY),
+            (6, 3, "b", ACTION_BUY),
+            (7, 0, "c", ACTION_SELL),
+            (6, 1, "a", ACTION_SELL),
+        ])
+        assert txs.block_order() == [3, 1, 2, 0]
+
+    def test_signers_interned(self):
+        """Repeated signers share one id."""
+        txs = _batch([(1, 0, "a", ACTION_BUY), (1, 1, "b", ACTION_BUY), (1, 2, "a", ACTION_SELL)])
+        assert list(txs.signer_id) == [0, 1, 0]
+        assert txs.signers == ["a", "b"]
+
+
+class TestThreatDetectionMethods:
+    """Test suite for ThreatDetectionMethods kernels."""
+
+    @pytest.fixture
+    def methods(self):
+        """Create detector instance (the client is unused by these kernels)."""
+        return ThreatDetectionMethods(client=None)
+
+    def test_activity_patterns_scripted_wallet(self, methods):
+        """Rapid flips, repeated amounts and regular intervals are all flagged."""
+        activities = [
+            (0.0, ACTION_BUY, 1.0),
+            (10.0, ACTION_SELL, 1.0),
+            (20.0, ACTION_BUY, 1.0),
+            (30.0, ACTION_SELL, 1.0),
+        ]
+        assert methods._analyze_activity_patterns(activities) == (True, True, True)
+
+    def test_activity_patterns_organic_wallet(self, methods):
+        """Irregular, one-directional trades of varying size are not flagged."""
+        activities = [
+            (0.0, ACTION_BUY, 1.0),
+            (500.0, ACTION_BUY, 2.5),
+            (4000.0, ACTION_BUY, 0.3),
+            (4100.0, ACTION_BUY, 7.0),
+        ]
+        assert methods._analyze_activity_patterns(activities) == (False, False, False)
+
+    def test_front_running_threshold_is_a_ratio(self, methods):
+        """Front-running is reported by share of transactions, not a fixed count."""
+        # 12 sandwiches (36 txs) diluted by 164 unrelated buys: 6% front-run
+        rows = []
+        for slot in range(12):
+            rows += [(slot, 0, "mev", ACTION_BUY), (slot, 1, f"v{slot}", ACTION_BUY), (slot, 2, "mev", ACTION_SELL)]
+        rows += [(100 + i, 0, f"u{i}", ACTION_BUY) for i in range(164)]
+        ctx = ThreatContext(recent_txs=_batch(rows))
+        assert asyncio.run(methods.detect_front_running_risk(None, ctx)) is None
+
+        # The same 12 sandwiches in a 60-transaction batch: 20% front-run
+        ctx = ThreatContext(recent_txs=_batch(rows[:36] + rows[36:60]))
+        result = asyncio.run(methods.detect_front_running_risk(None, ctx))
+        assert result is not None
+        assert result[1] == pytest.approx(12 / 60)
+
+    def test_program_cache_entries_expire(self, methods):
+        """Mint account data is reloaded once its cache entry expires."""
+        loads = []
+
+        async def load(mint):
+            loads.append(mint)
+            return b"data"
+
+        methods._load_program_data = load
+        mint = "ProgramCacheTestMint"
+        _PROGRAM_CACHE.pop(mint, None)
+
+        asyncio.run(methods._fetch_program_data(mint))
+        asyncio.run(methods._fetch_program_data(mint))
+        assert loads == [mint]
+        assert _PROGRAM_CACHE[mint][1] is not None
+
+        # Force expiry
+        _PROGRAM_CACHE[mint] = (b"data", 0.0)
+        asyncio.run(methods._fetch_program_data(mint))
+        assert loads == [mint, mint]
+        _PROGRAM_CACHE.pop(mint, None)